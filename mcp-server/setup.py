@@ -0,0 +1,17 @@
+"""Optional native-extension build hook.
+
+The server is pure Python; when Cython is installed, the hot
+PHP-serialization helper in src/_php_fast.pyx is compiled as well and
+picked up automatically at import time.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(["src/_php_fast.pyx"], language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,19 @@
+# cython: language_level=3
+"""Compiled fast path for PHP-serializing LearnDash int-array meta.
+
+The common bulk case (learndash_course_users, group course_ids) is a
+plain list of ints; building the serialized form with a typed loop over
+a bytearray avoids phpserialize's per-element dispatch.
+"""
+
+
+cpdef str serialize_int_array(list items):
+    """Serialize a list of ints to PHP array format (a:N:{i:0;i:v;...})."""
+    cdef bytearray buf = bytearray(b"a:%d:{" % len(items))
+    cdef Py_ssize_t idx
+    cdef long long item
+    for idx in range(len(items)):
+        item = items[idx]
+        buf += b"i:%d;i:%d;" % (idx, item)
+    buf += b"}"
+    return bytes(buf).decode()
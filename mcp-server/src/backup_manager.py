@@ -1,34 +1,98 @@
 """WordPress Backup Manager for MCP Server."""
 
 import os
+import shlex
+import shutil
+import subprocess
 import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import paramiko
 from .config import WordPressConfig
 
+try:
+    import asyncssh
+except ImportError:  # Optional: only needed for create_backup_async()
+    asyncssh = None
+
+# SFTP transfer tuning: Paramiko defaults to a small window and 32 KiB
+# requests, which leaves the pipe idle on high-latency links. A bigger
+# window plus prefetched reads keeps many requests in flight.
+SFTP_WINDOW_SIZE = 2 ** 27 - 1
+SFTP_BLOCK_SIZE = 262144  # 256 KiB per read
+
+# wp-content is typically thousands of small theme/plugin files, so
+# downloading over several SFTP channels turns a latency-bound transfer
+# into a bandwidth-bound one.
+SFTP_DOWNLOAD_WORKERS = 8
+
+# Chunk size for streaming the database dump to disk
+DB_STREAM_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 class BackupError(Exception):
     """Exception raised for backup errors."""
     pass
 
 
+# Shared SSH clients keyed by (host, user, port, key_path) so repeated
+# backups skip the key exchange / auth handshake (~100-500ms each)
+_client_cache: dict[tuple, paramiko.SSHClient] = {}
+_client_cache_lock = threading.Lock()
+
+
 class BackupManager:
     """Manages WordPress site backups via SSH."""
 
-    def __init__(self, config: WordPressConfig, local_backup_dir: str = "./backups"):
+    def __init__(
+        self,
+        config: WordPressConfig,
+        local_backup_dir: str = "./backups",
+        persist: bool = True,
+    ):
         self.config = config
         self.local_backup_dir = Path(local_backup_dir)
+        self.persist = persist
         self.ssh_client: Optional[paramiko.SSHClient] = None
 
+    def __enter__(self) -> "BackupManager":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _cache_key(self) -> tuple:
+        return (
+            self.config.ssh_host,
+            self.config.ssh_user,
+            self.config.ssh_port,
+            self.config.ssh_key_path,
+        )
+
     def connect(self):
-        """Establish SSH connection."""
+        """Establish SSH connection, reusing a cached one when possible."""
         if self.ssh_client is not None:
-            return
+            transport = self.ssh_client.get_transport()
+            if transport is not None and transport.is_active():
+                return
+            self.ssh_client = None
+
+        if self.persist:
+            with _client_cache_lock:
+                cached = _client_cache.get(self._cache_key())
+                if cached is not None:
+                    transport = cached.get_transport()
+                    if transport is not None and transport.is_active():
+                        self.ssh_client = cached
+                        return
+                    _client_cache.pop(self._cache_key(), None)
 
-        self.ssh_client = paramiko.SSHClient()
-        self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
         connect_kwargs = {
             "hostname": self.config.ssh_host,
@@ -43,21 +107,58 @@ class BackupManager:
             connect_kwargs["look_for_keys"] = False
             connect_kwargs["allow_agent"] = False
 
-        self.ssh_client.connect(**connect_kwargs)
+        client.connect(**connect_kwargs)
+
+        # Larger packets and a wider flow-control window reduce SFTP
+        # framing/round-trip overhead on download paths. Channels copy
+        # default_window_size when opened, so set it before any open
+        transport = client.get_transport()
+        if transport is not None:
+            transport.default_max_packet_size = 65536
+            transport.default_window_size = SFTP_WINDOW_SIZE
+
+        self.ssh_client = client
+
+        if self.persist:
+            with _client_cache_lock:
+                _client_cache[self._cache_key()] = client
 
     def disconnect(self):
+        """Release the SSH connection.
+
+        When persist is enabled the cached connection stays open for the
+        next backup; use close() to actually tear it down.
+        """
+        if self.persist:
+            self.ssh_client = None
+            return
+        self.close()
+
+    def close(self):
         """Close SSH connection."""
         if self.ssh_client:
+            if self.persist:
+                with _client_cache_lock:
+                    _client_cache.pop(self._cache_key(), None)
             self.ssh_client.close()
             self.ssh_client = None
 
-    def create_backup(self, include_files: bool = True, include_database: bool = True) -> dict:
+    def create_backup(
+        self,
+        include_files: bool = True,
+        include_database: bool = True,
+        compression: str = "auto",
+    ) -> dict:
         """
         Create a complete WordPress backup.
 
         Args:
             include_files: Include wp-content directory
             include_database: Include database dump
+            compression: Archive compression (auto, zstd-long, pigz, gzip).
+                zstd-long uses a 128 MB match window that deduplicates the
+                repeated plugin/theme content typical of WordPress trees,
+                compressing faster and ~30-40% smaller than gzip.
 
         Returns:
             dict with backup information
@@ -85,7 +186,7 @@ class BackupManager:
         try:
             # 1. Backup Database
             if include_database:
-                db_file = backup_path / "database.sql"
+                db_file = backup_path / "database.sql.gz"
                 self._backup_database(db_file)
                 results["database_backed_up"] = True
                 results["database_size"] = self._get_file_size(db_file)
@@ -103,8 +204,10 @@ class BackupManager:
                 self._backup_wp_config(wp_config_file)
 
             # 4. Create compressed archive
-            archive_path = self.local_backup_dir / f"{backup_name}.tar.gz"
-            self._create_archive(backup_path, archive_path)
+            compression = self._resolve_compression(compression)
+            suffix = ".tar.zst" if compression == "zstd-long" else ".tar.gz"
+            archive_path = self.local_backup_dir / f"{backup_name}{suffix}"
+            self._create_archive(backup_path, archive_path, compression)
             results["archive_created"] = True
             results["archive_path"] = str(archive_path)
             results["total_size"] = self._get_file_size(archive_path)
@@ -119,89 +222,438 @@ class BackupManager:
         finally:
             self.disconnect()
 
-    def _backup_database(self, local_path: Path):
-        """Backup WordPress database."""
-        command = f"cd {self.config.remote_path} && wp db export - --allow-root"
+    def create_backup_streamed(self, include_database: bool = True) -> dict:
+        """
+        Create a backup without staging files on disk.
+
+        Streams a tar of wp-content and wp-config.php produced remotely
+        straight into a local compressor, so each byte is read once
+        instead of being downloaded, re-read for compression, and deleted.
+
+        Args:
+            include_database: Include database dump
+
+        Returns:
+            dict with backup information
+        """
+        self.connect()
+        self.local_backup_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"sst_nyc_{timestamp}"
+        archive_path = self.local_backup_dir / f"{backup_name}.tar.gz"
+
+        results = {
+            "timestamp": timestamp,
+            "backup_name": backup_name,
+            "files_backed_up": False,
+            "database_backed_up": False,
+            "archive_created": False,
+            "total_size": "0 MB",
+        }
+
+        try:
+            if include_database:
+                db_file = self.local_backup_dir / f"{backup_name}_database.sql.gz"
+                self._backup_database(db_file)
+                results["database_backed_up"] = True
+                results["database_path"] = str(db_file)
+                results["database_size"] = self._get_file_size(db_file)
+
+            self._stream_archive(archive_path)
+            results["files_backed_up"] = True
+            results["archive_created"] = True
+            results["archive_path"] = str(archive_path)
+            results["total_size"] = self._get_file_size(archive_path)
+
+            return results
+
+        except Exception as e:
+            raise BackupError(f"Backup failed: {str(e)}")
+        finally:
+            self.disconnect()
+
+    async def create_backup_async(
+        self, include_files: bool = True, include_database: bool = True
+    ) -> dict:
+        """
+        Create a complete WordPress backup over asyncssh.
+
+        asyncssh pipelines many SFTP read requests on a single channel,
+        so downloads saturate the link without a thread pool. Requires
+        the optional asyncssh dependency.
+
+        Args:
+            include_files: Include wp-content directory
+            include_database: Include database dump
+
+        Returns:
+            dict with backup information
+        """
+        if asyncssh is None:
+            raise BackupError(
+                "asyncssh is required for async backups (pip install asyncssh)"
+            )
+
+        self.local_backup_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"sst_nyc_{timestamp}"
+        backup_path = self.local_backup_dir / backup_name
+        backup_path.mkdir(exist_ok=True)
+
+        results = {
+            "timestamp": timestamp,
+            "backup_name": backup_name,
+            "backup_path": str(backup_path),
+            "files_backed_up": False,
+            "database_backed_up": False,
+            "archive_created": False,
+            "total_size": "0 MB",
+        }
+
+        connect_kwargs = {
+            "host": self.config.ssh_host,
+            "username": self.config.ssh_user,
+            "port": self.config.ssh_port,
+            "known_hosts": None,
+        }
+        if self.config.ssh_key_path:
+            connect_kwargs["client_keys"] = [self.config.ssh_key_path]
+        elif self.config.ssh_password:
+            connect_kwargs["password"] = self.config.ssh_password
+
+        try:
+            async with asyncssh.connect(**connect_kwargs) as conn:
+                if include_database:
+                    db_file = backup_path / "database.sql.gz"
+                    await self._backup_database_async(conn, db_file)
+                    results["database_backed_up"] = True
+                    results["database_size"] = self._get_file_size(db_file)
+
+                if include_files:
+                    wp_content_dir = backup_path / "wp-content"
+                    async with conn.start_sftp_client() as sftp:
+                        await sftp.mget(
+                            f"{self.config.remote_path}/wp-content",
+                            str(backup_path),
+                            recurse=True,
+                            preserve=True,
+                            max_requests=256,
+                            block_size=32768,
+                        )
+                        try:
+                            await sftp.get(
+                                f"{self.config.remote_path}/wp-config.php",
+                                str(backup_path / "wp-config.php"),
+                            )
+                        except Exception:
+                            # wp-config.php might not be readable, skip
+                            pass
+                    results["files_backed_up"] = True
+                    results["files_size"] = self._get_dir_size(wp_content_dir)
+
+            archive_path = self.local_backup_dir / f"{backup_name}.tar.gz"
+            self._create_archive(backup_path, archive_path)
+            results["archive_created"] = True
+            results["archive_path"] = str(archive_path)
+            results["total_size"] = self._get_file_size(archive_path)
+
+            self._cleanup_directory(backup_path)
+
+            return results
+
+        except BackupError:
+            raise
+        except Exception as e:
+            raise BackupError(f"Backup failed: {str(e)}")
+
+    async def _backup_database_async(self, conn, local_path: Path):
+        """Stream a gzipped database dump to disk over asyncssh."""
+        # pipefail so a failed export surfaces as a non-zero exit instead
+        # of gzip's success status (which would leave a tiny valid .gz)
+        command = (
+            "bash -c 'set -o pipefail; "
+            f"cd {self.config.remote_path} && wp db export - --allow-root | gzip -1'"
+        )
+        async with conn.create_process(command, encoding=None) as process:
+            with open(local_path, 'wb') as f:
+                while True:
+                    data = await process.stdout.read(DB_STREAM_CHUNK_SIZE)
+                    if not data:
+                        break
+                    f.write(data)
+            await process.wait()
+            if process.returncode != 0:
+                error = (await process.stderr.read()).decode('utf-8', 'replace')
+                raise BackupError(f"Database backup failed: {error}")
+
+    def _stream_archive(self, archive_path: Path):
+        """Stream remote tar of wp-content + wp-config.php into a local gzip."""
+        # wp-config.php is optional, matching the staged and async
+        # paths; list it only when readable so a missing file does not
+        # abort the whole archive. tar's stderr is kept so a real
+        # failure produces a useful BackupError message
+        command = (
+            f"cd {self.config.remote_path} && "
+            "tar -cf - wp-content "
+            "$(test -r wp-config.php && echo wp-config.php)"
+        )
         stdin, stdout, stderr = self.ssh_client.exec_command(command)
+
+        compressor = self._detect_compressor()
+        if compressor == "pigz":
+            compress_cmd = ["pigz", "-p", str(os.cpu_count())]
+        else:
+            compress_cmd = ["gzip"]
+
+        with open(archive_path, 'wb') as archive_file:
+            proc = subprocess.Popen(
+                compress_cmd, stdin=subprocess.PIPE, stdout=archive_file
+            )
+            try:
+                shutil.copyfileobj(stdout, proc.stdin, length=DB_STREAM_CHUNK_SIZE)
+            finally:
+                proc.stdin.close()
+                proc.wait()
+
         exit_code = stdout.channel.recv_exit_status()
+        if exit_code != 0 or proc.returncode != 0:
+            error = stderr.read().decode('utf-8')
+            raise BackupError(f"Streamed archive failed: {error}")
 
+    def _backup_database(self, local_path: Path):
+        """Backup WordPress database as a streamed gzip dump.
+
+        The dump is gzipped remotely and streamed to disk in chunks so a
+        multi-GB database never has to fit in memory.
+        """
+        # pipefail so a failed export surfaces as a non-zero exit instead
+        # of gzip's success status (which would leave a tiny valid .gz)
+        command = (
+            "bash -c 'set -o pipefail; "
+            f"cd {self.config.remote_path} && wp db export - --allow-root | gzip -1'"
+        )
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+
+        # Stream the dump to disk while the remote command is still running
+        with open(local_path, 'wb') as f:
+            while True:
+                data = stdout.read(DB_STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                f.write(data)
+
+        exit_code = stdout.channel.recv_exit_status()
         if exit_code != 0:
             error = stderr.read().decode('utf-8')
             raise BackupError(f"Database backup failed: {error}")
 
-        # Write database dump to file
-        with open(local_path, 'wb') as f:
-            f.write(stdout.read())
-
     def _backup_files(self, local_path: Path):
         """Backup wp-content directory."""
         local_path.mkdir(parents=True, exist_ok=True)
 
-        # Use SFTP to download wp-content recursively
-        sftp = self.ssh_client.open_sftp()
+        # Fetch the full manifest in one round trip, then download over
+        # parallel channels (the wide flow-control window is set on the
+        # transport at connect time)
         remote_wp_content = f"{self.config.remote_path}/wp-content"
-
-        try:
-            self._sftp_download_recursive(sftp, remote_wp_content, str(local_path))
-        finally:
-            sftp.close()
+        files = self._list_remote_files(remote_wp_content, local_path)
+        self._download_files_parallel(files)
 
     def _backup_wp_config(self, local_path: Path):
-        """Backup wp-config.php."""
-        sftp = self.ssh_client.open_sftp()
-        remote_config = f"{self.config.remote_path}/wp-config.php"
+        """Backup wp-config.php with a single exec round trip.
 
-        try:
-            sftp.get(remote_config, str(local_path))
-        except Exception:
-            # wp-config.php might not be readable, skip
-            pass
-        finally:
-            sftp.close()
+        SFTP needs OPEN/READ/CLOSE (three round trips) even for a small
+        file; cat over the exec channel is one request/response.
+        """
+        command = f"cat {shlex.quote(self.config.remote_path)}/wp-config.php"
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+        data = stdout.read()
 
-    def _sftp_download_recursive(self, sftp: paramiko.SFTPClient, remote_dir: str, local_dir: str):
-        """Recursively download directory via SFTP."""
-        local_path = Path(local_dir)
-        local_path.mkdir(parents=True, exist_ok=True)
+        if stdout.channel.recv_exit_status() == 0:
+            local_path.write_bytes(data)
+        # Non-zero exit: wp-config.php might not be readable, skip
+
+    def _list_remote_files(self, remote_dir: str, local_dir: Path) -> list[tuple[str, Path]]:
+        """List every file under a remote directory in a single round trip.
+
+        A recursive SFTP walk costs one listdir RPC per directory; one
+        find over the exec channel returns the whole manifest at once.
+        Local directories are pre-created so downloads can start
+        immediately.
+
+        Returns:
+            List of (remote_path, local_path) tuples for every file found
+        """
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        command = f"find {shlex.quote(remote_dir)} -printf '%y\\t%P\\n'"
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+        manifest = stdout.read().decode('utf-8', 'replace')
+
+        exit_code = stdout.channel.recv_exit_status()
+        if exit_code != 0:
+            error = stderr.read().decode('utf-8')
+            raise BackupError(f"Remote file listing failed: {error}")
+
+        files = []
+        for line in manifest.splitlines():
+            entry_type, _, rel_path = line.partition('\t')
+            if not rel_path:
+                continue
+            if entry_type == 'd':
+                (local_dir / rel_path).mkdir(parents=True, exist_ok=True)
+            elif entry_type == 'f':
+                files.append((f"{remote_dir}/{rel_path}", local_dir / rel_path))
+
+        return files
+
+    def _download_files_parallel(self, files: list[tuple[str, Path]]):
+        """Download files concurrently, one SFTP channel per worker thread."""
+        if not files:
+            return
+
+        local = threading.local()
+        channels: list[paramiko.SFTPClient] = []
+        channels_lock = threading.Lock()
 
-        for item in sftp.listdir_attr(remote_dir):
-            remote_path = f"{remote_dir}/{item.filename}"
-            local_item = local_path / item.filename
+        def download(entry: tuple[str, Path]):
+            if not hasattr(local, "sftp"):
+                local.sftp = self.ssh_client.open_sftp()
+                with channels_lock:
+                    channels.append(local.sftp)
+            self._sftp_download_file(local.sftp, entry[0], entry[1])
 
-            if item.st_mode & 0o40000:  # Directory
-                self._sftp_download_recursive(sftp, remote_path, str(local_item))
-            else:  # File
-                sftp.get(remote_path, str(local_item))
+        workers = min(SFTP_DOWNLOAD_WORKERS, len(files))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() propagates the first worker exception to the caller
+                list(executor.map(download, files))
+        finally:
+            # The transport keeps every channel referenced until it
+            # closes, and a persisted connection outlives this backup —
+            # leaked worker channels would exhaust sshd's MaxSessions
+            for sftp in channels:
+                try:
+                    sftp.close()
+                except Exception:
+                    pass
+
+    def _sftp_download_file(self, sftp: paramiko.SFTPClient, remote_path: str, local_path: Path):
+        """Download a single file with pipelined reads.
+
+        prefetch() issues read requests for the whole file up front so
+        transfers are bound by bandwidth instead of per-request round trips.
+        """
+        with sftp.open(remote_path, 'rb') as remote_file:
+            remote_file.prefetch()
+            remote_file.set_pipelined(True)
+            with open(local_path, 'wb') as local_file:
+                shutil.copyfileobj(remote_file, local_file, length=SFTP_BLOCK_SIZE)
+
+    def _detect_compressor(self) -> Optional[str]:
+        """Find a multi-threaded gzip compressor on PATH, if any."""
+        for tool in ("pigz", "gzip"):
+            if shutil.which(tool):
+                return tool
+        return None
+
+    def _resolve_compression(self, compression: str) -> str:
+        """Resolve 'auto' to the best available gzip-compatible tool.
+
+        "tarfile" (Python's built-in, single-threaded gzip) is accepted
+        so an already-resolved value survives a second resolution —
+        create_backup resolves before _create_archive resolves again.
+        """
+        if compression != "auto":
+            if compression not in ("zstd-long", "pigz", "gzip", "tarfile"):
+                raise BackupError(f"Unknown compression: {compression}")
+            return compression
+        return self._detect_compressor() or "tarfile"
+
+    def _compress_program(self, compression: str) -> str:
+        """Build the tar --use-compress-program string."""
+        if compression == "zstd-long":
+            return "zstd -T0 -15 --long=27"
+        if compression == "pigz":
+            return f"pigz -p {os.cpu_count()}"
+        return "gzip"
+
+    def _create_archive(self, source_dir: Path, archive_path: Path, compression: str = "auto"):
+        """Create a compressed tar archive.
+
+        Shells out to tar with the selected compressor (zstd long-range,
+        pigz, or gzip) so compression can use all cores; Python's
+        single-threaded tarfile gzip is the fallback.
+        """
+        compression = self._resolve_compression(compression)
+
+        if compression != "tarfile":
+            subprocess.run(
+                [
+                    "tar", "--use-compress-program", self._compress_program(compression),
+                    "-cf", str(archive_path),
+                    "-C", str(source_dir.parent), source_dir.name,
+                ],
+                check=True,
+            )
+            return
 
-    def _create_archive(self, source_dir: Path, archive_path: Path):
-        """Create compressed tar.gz archive."""
         with tarfile.open(archive_path, "w:gz") as tar:
             tar.add(source_dir, arcname=source_dir.name)
 
+    def _extract_archive(self, archive_path: Path, dest_dir: Path):
+        """Extract a backup archive, dispatching on its suffix."""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        if archive_path.name.endswith(".tar.zst"):
+            subprocess.run(
+                [
+                    "tar", "--use-compress-program", "zstd -d --long=27",
+                    "-xf", str(archive_path), "-C", str(dest_dir),
+                ],
+                check=True,
+            )
+            return
+
+        with tarfile.open(archive_path, "r:gz") as tar:
+            tar.extractall(dest_dir)
+
     def _cleanup_directory(self, directory: Path):
         """Remove directory and all contents."""
         import shutil
         if directory.exists():
             shutil.rmtree(directory)
 
-    def _get_file_size(self, file_path: Path) -> str:
-        """Get human-readable file size."""
-        size_bytes = file_path.stat().st_size
+    def _human_size(self, size_bytes: float) -> str:
+        """Format a byte count as a human-readable size."""
         for unit in ['B', 'KB', 'MB', 'GB']:
             if size_bytes < 1024.0:
                 return f"{size_bytes:.1f} {unit}"
             size_bytes /= 1024.0
         return f"{size_bytes:.1f} TB"
 
+    def _get_file_size(self, file_path: Path) -> str:
+        """Get human-readable file size."""
+        return self._human_size(file_path.stat().st_size)
+
     def _get_dir_size(self, directory: Path) -> str:
-        """Get human-readable directory size."""
-        total_size = sum(f.stat().st_size for f in directory.rglob('*') if f.is_file())
-        size_bytes = total_size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        """Get human-readable directory size.
+
+        Uses os.scandir, whose DirEntry.stat() is cached from the
+        directory read on Linux, instead of a Path.rglob pass that pays
+        a stat syscall and a Path allocation per file.
+        """
+        total_size = 0
+        stack = [str(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat().st_size
+        return self._human_size(total_size)
 
     def list_backups(self) -> list[dict]:
         """List all available local backups."""
@@ -210,13 +662,17 @@ class BackupManager:
         if not self.local_backup_dir.exists():
             return backups
 
-        for backup_file in self.local_backup_dir.glob("*.tar.gz"):
-            backups.append({
-                "filename": backup_file.name,
-                "path": str(backup_file),
-                "size": self._get_file_size(backup_file),
-                "created": datetime.fromtimestamp(backup_file.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-            })
+        with os.scandir(self.local_backup_dir) as it:
+            for entry in it:
+                if not entry.name.endswith((".tar.gz", ".tar.zst")) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                backups.append({
+                    "filename": entry.name,
+                    "path": entry.path,
+                    "size": self._human_size(stat.st_size),
+                    "created": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+                })
 
         return sorted(backups, key=lambda x: x["created"], reverse=True)
 
@@ -3,10 +3,10 @@
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WordPressConfig:
     """WordPress site configuration."""
 
@@ -28,6 +28,15 @@ class WordPressConfig:
     mailchimp_server: Optional[str] = None
     mailchimp_list_id: Optional[str] = None
 
+    # Required fields checked by validate(), as (attribute, error) pairs
+    _REQUIRED: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("site_url", "WP_SITE_URL is required"),
+        ("ssh_host", "WP_SSH_HOST is required"),
+        ("ssh_user", "WP_SSH_USER is required"),
+        ("api_user", "WP_API_USER is required"),
+        ("api_password", "WP_API_PASSWORD is required"),
+    )
+
     @classmethod
     def from_env(cls) -> "WordPressConfig":
         """Load configuration from environment variables."""
@@ -53,18 +62,11 @@ class WordPressConfig:
 
     def validate(self) -> list[str]:
         """Validate required configuration."""
-        errors = []
-
-        if not self.site_url:
-            errors.append("WP_SITE_URL is required")
-        if not self.ssh_host:
-            errors.append("WP_SSH_HOST is required")
-        if not self.ssh_user:
-            errors.append("WP_SSH_USER is required")
-        if not self.api_user:
-            errors.append("WP_API_USER is required")
-        if not self.api_password:
-            errors.append("WP_API_PASSWORD is required")
+        errors = [
+            message
+            for attr, message in self._REQUIRED
+            if not getattr(self, attr)
+        ]
 
         if self.ssh_key_path and not Path(self.ssh_key_path).exists():
             errors.append(f"SSH key not found: {self.ssh_key_path}")
@@ -1,20 +1,238 @@
 """LearnDash LMS management for course creation and editing."""
 
+import base64
 import json
+import os
+import re
 import shlex
+import sqlite3
 import logging
-from typing import Optional, Literal, Union, Any
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from itertools import repeat
+from typing import ClassVar, Optional, Literal, Union, Any
 from .config import WordPressConfig
 from .wp_cli import WPCLIClient
 
+try:
+    import phpserialize
+except ImportError:  # Optional: PHP-serialized meta is returned raw without it
+    phpserialize = None
+
+try:
+    from ._php_fast import serialize_int_array as _serialize_int_array_fast
+except ImportError:  # Optional compiled helper (built when Cython is present)
+    _serialize_int_array_fast = None
+
+try:  # Optional: orjson shaves per-call constant overhead in bulk flows
+    import orjson
+
+    _jloads = orjson.loads
+
+    def _jdumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _jloads = json.loads
+    _jdumps = json.dumps
+
+
+# Sentinel distinguishing a cache miss from a cached None
+_CACHE_MISS = object()
+
+# Compiled once at import: cheap guard for PHP-serialized values
+# (a:, O:, s:, i:, d:, b:, or bare N;) so the hot _unserialize_php path
+# can skip encode + parse + exception handling on plain strings
+_PHP_SERIALIZED_RE = re.compile(r'^(?:[abdisO]:|N;)')
+
+
+def _compute_group_progress(config_dict: dict, group_id: int) -> dict:
+    """
+    ProcessPoolExecutor worker for bulk_group_progress.
+
+    Lives at module level so it is picklable; takes the config as a
+    plain dict for the same reason. Each worker process builds its own
+    WPCLIClient, so SSH channels (and any persistent wp shell) are never
+    shared across processes.
+    """
+    config = WordPressConfig(**config_dict)
+    cli = WPCLIClient(config)
+    try:
+        return LearnDashManager(config, cli).get_group_progress(group_id)
+    finally:
+        cli.disconnect()
+
 
 class LearnDashManager:
     """Manage LearnDash courses, lessons, quizzes, and enrollments."""
 
+    # Analytics loops re-read the same meta and lesson lists for every
+    # student; a short TTL keeps repeat reads in-process while staying
+    # fresh enough for interactive use
+    CACHE_TTL_SECONDS = 30.0
+
+    # Bound on read-cache entries; long-running MCP sessions touching
+    # many posts evict oldest-first rather than growing without limit
+    CACHE_MAX_ENTRIES = 4096
+
+    # Max users processed per remote `wp eval` call in bulk operations
+    BULK_EVAL_CHUNK = 500
+
+    # Concurrent wp-cli round trips when reports fan out across courses
+    REPORT_WORKERS = 8
+
+    # Allowed post statuses, hoisted so hot call sites don't rebuild
+    # a throwaway list per validation
+    _COURSE_STATUSES: ClassVar[tuple[str, ...]] = ("publish", "draft", "private")
+    _CONTENT_STATUSES: ClassVar[tuple[str, ...]] = ("publish", "draft")
+
+    # Our question-type names -> LearnDash's, allocated once at import
+    _QUESTION_TYPE_MAP: ClassVar[dict[str, str]] = {
+        "single": "single",
+        "multiple": "multiple",
+        "free_answer": "free_answer",
+        "essay": "essay_text",
+    }
+    _QUESTION_TYPES: ClassVar[tuple[str, ...]] = tuple(_QUESTION_TYPE_MAP)
+
+    # Local course-overview cache surviving across manager instances;
+    # rows are invalidated by the mutating methods
+    OVERVIEW_DB_PATH = os.path.join(tempfile.gettempdir(), "ld_overview.sqlite")
+
     def __init__(self, config: WordPressConfig, wp_cli: WPCLIClient):
         self.config = config
         self.cli = wp_cli
         self.logger = logging.getLogger(__name__)
+        self._read_cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_pinned = False
+        # lesson_id -> course_id, seeded by create_lesson and filled on
+        # demand; bulk topic creation under one lesson hits it every time
+        self._lesson_course: dict[int, int] = {}
+        self._index_checked = False
+        self._overview_db: Optional[sqlite3.Connection] = None
+
+    # ==================== READ CACHE ====================
+
+    def _cache_lookup(self, key: tuple) -> Any:
+        """Return a cached value, or _CACHE_MISS if absent/expired."""
+        entry = self._read_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        if self._cache_pinned or time.monotonic() - entry[0] < self.CACHE_TTL_SECONDS:
+            return entry[1]
+        return _CACHE_MISS
+
+    def _cache_store(self, key: tuple, value: Any) -> Any:
+        """Store a value in the read cache and return it."""
+        if (
+            key not in self._read_cache
+            and len(self._read_cache) >= self.CACHE_MAX_ENTRIES
+        ):
+            # Insertion order approximates age well enough under a TTL;
+            # a strict LRU is not worth the bookkeeping here
+            self._read_cache.pop(next(iter(self._read_cache)))
+        self._read_cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_cache(self, post_id: Optional[int] = None):
+        """
+        Drop cached reads.
+
+        Args:
+            post_id: Limit invalidation to entries for this post
+                (meta reads and child lists keyed by it); None clears all
+        """
+        if post_id is None:
+            self._read_cache.clear()
+            return
+        stale = [key for key in self._read_cache if key[1] == post_id]
+        for key in stale:
+            del self._read_cache[key]
+
+    def _invalidate_kind(self, kind: str) -> None:
+        """Drop all cached reads of one kind (e.g. course listings)."""
+        stale = [key for key in self._read_cache if key[0] == kind]
+        for key in stale:
+            del self._read_cache[key]
+
+    @contextmanager
+    def analytics_session(self):
+        """
+        Pin cached reads for the duration of an analytics loop.
+
+        Per-student loops (get_user_progress over a whole course, group
+        reports) re-read the same lesson lists and course meta for every
+        user; inside this block cached entries never expire, so each is
+        fetched at most once. The cache is flushed on exit so pinned
+        data cannot leak into later interactive calls.
+
+        Usage:
+            with manager.analytics_session():
+                for uid in user_ids:
+                    manager.get_user_progress(uid, course_id)
+        """
+        self._cache_pinned = True
+        try:
+            yield self
+        finally:
+            self._cache_pinned = False
+            self._read_cache.clear()
+
+    # ==================== COURSE OVERVIEW CACHE ====================
+
+    def _overview(self) -> sqlite3.Connection:
+        """Lazily open the local course-overview SQLite cache."""
+        if self._overview_db is None:
+            self._overview_db = sqlite3.connect(self.OVERVIEW_DB_PATH)
+            self._overview_db.execute(
+                "CREATE TABLE IF NOT EXISTS course_overview ("
+                "course_id INTEGER PRIMARY KEY, title TEXT, status TEXT, "
+                "lesson_count INTEGER, ts REAL)"
+            )
+        return self._overview_db
+
+    def _overview_lesson_count(self, course_id: int) -> Optional[int]:
+        """Return the cached lesson count, or None on miss."""
+        row = self._overview().execute(
+            "SELECT lesson_count FROM course_overview WHERE course_id = ?",
+            (course_id,),
+        ).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def _overview_store(
+        self,
+        course_id: int,
+        title: Optional[str] = None,
+        status: Optional[str] = None,
+        lesson_count: Optional[int] = None,
+    ) -> None:
+        """Upsert an overview row, keeping existing columns on None."""
+        conn = self._overview()
+        conn.execute(
+            "INSERT INTO course_overview (course_id, title, status, lesson_count, ts) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(course_id) DO UPDATE SET "
+            "title = COALESCE(excluded.title, title), "
+            "status = COALESCE(excluded.status, status), "
+            "lesson_count = COALESCE(excluded.lesson_count, lesson_count), "
+            "ts = excluded.ts",
+            (course_id, title, status, lesson_count, time.time()),
+        )
+        conn.commit()
+
+    def _overview_invalidate(self, course_id: Optional[int] = None) -> None:
+        """Drop overview rows after a mutation (all rows when None)."""
+        conn = self._overview()
+        if course_id is None:
+            conn.execute("DELETE FROM course_overview")
+        else:
+            conn.execute(
+                "DELETE FROM course_overview WHERE course_id = ?", (course_id,)
+            )
+        conn.commit()
 
     # ==================== VALIDATION HELPERS ====================
 
@@ -61,7 +279,9 @@ class LearnDashManager:
         if not isinstance(value, str):
             raise ValueError(f"{name} must be a string, got {type(value).__name__}")
 
-        if not allow_empty and not value.strip():
+        # isspace() avoids strip()'s full-copy allocation: a 50KB course
+        # body would otherwise be duplicated just to test emptiness
+        if not allow_empty and (not value or value.isspace()):
             raise ValueError(f"{name} cannot be empty")
 
         if max_length and len(value) > max_length:
@@ -72,7 +292,7 @@ class LearnDashManager:
         return value
 
     def _validate_literal(
-        self, value: Any, name: str, allowed_values: list[str]
+        self, value: Any, name: str, allowed_values: Union[list[str], tuple[str, ...]]
     ) -> str:
         """
         Validate that value is one of allowed literal values.
@@ -80,7 +300,8 @@ class LearnDashManager:
         Args:
             value: Value to validate
             name: Parameter name for error messages
-            allowed_values: List of allowed values
+            allowed_values: Allowed values (the class-level status/type
+                tuples, or any ad-hoc sequence)
 
         Returns:
             Validated value
@@ -146,6 +367,102 @@ class LearnDashManager:
 
         return value
 
+    def _unserialize_php(self, data: Any) -> Any:
+        """
+        Parse a PHP-serialized value from post/user meta.
+
+        Uses phpserialize, which handles nested arrays and byte-counted
+        strings correctly; hand-rolled parsing gets multibyte UTF-8
+        wrong because PHP lengths are byte counts.
+
+        Args:
+            data: Raw meta value (possibly PHP-serialized)
+
+        Returns:
+            Parsed value, or the input unchanged when it is not
+            serialized or phpserialize is unavailable
+        """
+        if phpserialize is None or not isinstance(data, str) or not data:
+            return data
+
+        if not _PHP_SERIALIZED_RE.match(data):
+            return data
+
+        try:
+            return phpserialize.loads(data.encode(), decode_strings=True)
+        except Exception:
+            return data
+
+    def _serialize_php_array(self, items: Union[list, dict]) -> str:
+        """
+        Serialize a Python list or dict to PHP array format.
+
+        Args:
+            items: Values to serialize
+
+        Returns:
+            PHP-serialized string
+
+        Raises:
+            ValueError: If phpserialize is not installed
+        """
+        # Common LearnDash case (user_ids, course_ids): delegate to the
+        # compiled helper when it was built
+        if (
+            _serialize_int_array_fast is not None
+            and isinstance(items, list)
+            and all(type(i) is int for i in items)
+        ):
+            return _serialize_int_array_fast(items)
+
+        if phpserialize is None:
+            raise ValueError(
+                "phpserialize is required to write serialized meta "
+                "(pip install phpserialize)"
+            )
+        return phpserialize.dumps(items).decode()
+
+    def _create_post(
+        self,
+        post_type: str,
+        title: str,
+        status: str,
+        content: str = "",
+        meta: Optional[dict] = None,
+    ) -> int:
+        """
+        Create a post with all of its meta in one wp-cli call.
+
+        Every create_* method funnels through here: the meta dict rides
+        along as --meta_input and --porcelain returns just the new ID,
+        so each entity costs exactly one PHP bootstrap. Arguments are
+        passed argv-style; quoting is centralized in execute_argv.
+
+        Args:
+            post_type: WordPress post type
+            title: Post title (pre-validated)
+            status: Post status
+            content: Post content (omitted when empty)
+            meta: Meta keys to set on the new post
+
+        Returns:
+            New post ID
+        """
+        argv = [
+            "post",
+            "create",
+            f"--post_type={post_type}",
+            f"--post_title={title}",
+            f"--post_status={status}",
+        ]
+        if content:
+            argv.append(f"--post_content={content}")
+        if meta:
+            argv.append(f"--meta_input={_jdumps(meta)}")
+        argv.append("--porcelain")
+
+        return self.cli.execute_argv(argv, format=None, returns=int)
+
     def _get_meta(self, post_id: int, meta_key: str) -> Optional[str]:
         """
         Get post meta value.
@@ -157,14 +474,53 @@ class LearnDashManager:
         Returns:
             Meta value or None if not found
         """
+        key = ("post_meta", post_id, meta_key)
+        cached = self._cache_lookup(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             # Security: Quote all parameters to prevent command injection
             cmd = f'post meta get {shlex.quote(str(post_id))} {shlex.quote(meta_key)}'
             result = self.cli.execute(cmd)
-            return result if result else None
+            return self._cache_store(key, result if result else None)
         except Exception:
             return None
 
+    def _ensure_postmeta_index(self) -> None:
+        """
+        Create a (meta_key, meta_value) index on wp_postmeta if missing.
+
+        WordPress only indexes meta_key; the meta_value half of our
+        course_id filters falls back to scanning every matching key row.
+        Checked lazily once per process, and never allowed to fail a
+        read path — sites where the DB user lacks DDL rights just keep
+        the stock indexes.
+        """
+        if self._index_checked:
+            return
+        self._index_checked = True
+
+        try:
+            check = (
+                "SHOW INDEX FROM wp_postmeta WHERE Key_name = 'ld_meta_key_value'"
+            )
+            raw = self.cli.execute(
+                f'db query {shlex.quote(check)} --skip-column-names', format=None
+            )
+            if str(raw).strip():
+                return
+            create = (
+                "CREATE INDEX ld_meta_key_value "
+                "ON wp_postmeta (meta_key(191), meta_value(32))"
+            )
+            self.cli.execute(
+                f'db query {shlex.quote(create)}', format=None
+            )
+            self.logger.info("Created wp_postmeta (meta_key, meta_value) index")
+        except Exception as e:
+            self.logger.warning(f"postmeta index check skipped: {e}")
+
     # ==================== COURSE MANAGEMENT ====================
 
     def create_course(
@@ -197,34 +553,29 @@ class LearnDashManager:
             content = self._validate_string(
                 content, "content", max_length=50000, allow_empty=True
             )
-        status = self._validate_literal(status, "status", ["publish", "draft", "private"])
+        status = self._validate_literal(status, "status", self._COURSE_STATUSES)
         if price is not None:
             price = self._validate_float(price, "price", min_value=0.0)
         if certificate_id is not None:
             certificate_id = self._validate_positive_int(certificate_id, "certificate_id")
 
-        # Create course post with properly escaped values
-        cmd = f'post create --post_type=sfwd-courses --post_title={shlex.quote(title)} --post_status={status}'
-
-        if content:
-            cmd += f' --post_content={shlex.quote(content)}'
-
-        result = self.cli.execute(cmd, format="json")
-        course_id = result if isinstance(result, int) else int(result)
-
-        # Set course meta (Security: quote all parameters)
+        # LearnDash settings live in one serialized array under
+        # _sfwd-courses, so the keys are set together as a full dict
+        sfwd_settings = {}
         if price is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(course_id))} {shlex.quote("_sfwd-courses")} '
-                f'{shlex.quote("_sfwd-courses[sfwd-courses_course_price]")} {shlex.quote(str(price))}'
-            )
-
+            sfwd_settings["sfwd-courses_course_price"] = price
         if certificate_id:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(course_id))} {shlex.quote("_sfwd-courses")} '
-                f'{shlex.quote("_sfwd-courses[sfwd-courses_certificate]")} {shlex.quote(str(certificate_id))}'
-            )
+            sfwd_settings["sfwd-courses_certificate"] = certificate_id
+
+        course_id = self._create_post(
+            "sfwd-courses",
+            title,
+            status,
+            content,
+            {"_sfwd-courses": sfwd_settings} if sfwd_settings else None,
+        )
 
+        self._invalidate_kind("courses")
         self.logger.info(f"Created course {course_id}: {title}")
 
         return {
@@ -261,6 +612,12 @@ class LearnDashManager:
         """
         # Validate inputs
         course_id = self._validate_positive_int(course_id, "course_id")
+
+        # Sparse-diff pipelines call this with nothing to change; skip
+        # the remote boot (and cache flush) entirely for no-ops
+        if title is None and content is None and status is None and price is None:
+            return {"id": course_id, "updated": False}
+
         if title is not None:
             title = self._validate_string(title, "title", max_length=200)
         if content is not None:
@@ -269,51 +626,90 @@ class LearnDashManager:
             )
         if status is not None:
             status = self._validate_literal(
-                status, "status", ["publish", "draft", "private"]
+                status, "status", self._COURSE_STATUSES
             )
         if price is not None:
             price = self._validate_float(price, "price", min_value=0.0)
 
-        updates = []
-
+        fields = {}
         if title:
-            updates.append(f'--post_title={shlex.quote(title)}')
+            fields['post_title'] = title
         if content is not None:
-            updates.append(f'--post_content={shlex.quote(content)}')
+            fields['post_content'] = content
         if status:
-            updates.append(f'--post_status={status}')
-
-        if updates:
-            cmd = f'post update {shlex.quote(str(course_id))} {" ".join(updates)}'
-            self.cli.execute(cmd)
+            fields['post_status'] = status
 
-        if price is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(course_id))} {shlex.quote("_sfwd-courses")} '
-                f'{shlex.quote("_sfwd-courses[sfwd-courses_course_price]")} {shlex.quote(str(price))}'
+        if price is None:
+            argv = ['post', 'update', str(course_id)]
+            argv.extend(f'--{key}={value}' for key, value in fields.items())
+            self.cli.execute_argv(argv, format=None)
+        else:
+            # Field changes and the price write share one PHP boot. The
+            # price lives inside the serialized _sfwd-courses settings
+            # array, so it is merged rather than clobbered; the core
+            # fields travel base64-encoded to survive every quoting layer
+            fields['ID'] = course_id
+            payload = base64.b64encode(_jdumps(fields).encode()).decode()
+            php = (
+                f'$f = json_decode(base64_decode("{payload}"), true); '
+                'if (count($f) > 1) { wp_update_post($f); } '
+                f'$s = get_post_meta({course_id}, "_sfwd-courses", true); '
+                'if (!is_array($s)) { $s = array(); } '
+                f'$s["sfwd-courses_course_price"] = "{price}"; '
+                f'update_post_meta({course_id}, "_sfwd-courses", $s);'
             )
+            self.cli.execute_php(php)
 
+        self.invalidate_cache(course_id)
+        self._invalidate_kind("courses")
+        self._overview_invalidate(course_id)
         self.logger.info(f"Updated course {course_id}")
 
         return {"id": course_id, "updated": True}
 
-    def list_courses(self, status: str = "any", limit: int = 50) -> list[dict]:
+    def list_courses(
+        self, status: str = "any", limit: int = 50, include_content: bool = False
+    ) -> list[dict]:
         """
         List all LearnDash courses.
 
         Args:
             status: Post status filter (any, publish, draft)
             limit: Maximum number to return
+            include_content: Also return post_content (off by default;
+                course bodies can be kilobytes each)
 
         Returns:
             List of courses with metadata
         """
-        return self.cli.list_posts(
+        key = ("courses", None, status, limit, include_content)
+        cached = self._cache_lookup(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        fields = None if include_content else "ID,post_title,post_status,post_date"
+        courses = self.cli.list_posts(
             post_type="sfwd-courses",
             post_status=status,
-            limit=limit
+            limit=limit,
+            fields=fields,
         )
 
+        # Write-through to the overview cache so analytics reads
+        # (lesson counts, dashboards) can skip wp-cli on repeat hits
+        if isinstance(courses, list):
+            for course in courses:
+                try:
+                    self._overview_store(
+                        int(course["ID"]),
+                        title=course.get("post_title"),
+                        status=course.get("post_status"),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        return self._cache_store(key, courses)
+
     def delete_course(self, course_id: int, force: bool = False) -> dict:
         """
         Delete a course.
@@ -336,6 +732,9 @@ class LearnDashManager:
             cmd += ' --force'
 
         self.cli.execute(cmd)
+        self.invalidate_cache(course_id)
+        self._invalidate_kind("courses")
+        self._overview_invalidate(course_id)
         self.logger.info(f"Deleted course {course_id} (force={force})")
         return {"id": course_id, "deleted": True, "permanent": force}
 
@@ -372,32 +771,26 @@ class LearnDashManager:
             content = self._validate_string(
                 content, "content", max_length=50000, allow_empty=True
             )
-        status = self._validate_literal(status, "status", ["publish", "draft"])
+        status = self._validate_literal(status, "status", self._CONTENT_STATUSES)
         if order is not None:
             order = self._validate_positive_int(order, "order")
 
-        cmd = f'post create --post_type=sfwd-lessons --post_title={shlex.quote(title)} --post_status={status}'
-
-        if content:
-            cmd += f' --post_content={shlex.quote(content)}'
-
-        result = self.cli.execute(cmd, format="json")
-        lesson_id = result if isinstance(result, int) else int(result)
+        # Course association (and order) ride along on the create call
+        meta = {
+            "course_id": course_id,
+            f"ld_course_{course_id}": course_id,
+        }
+        if order is not None:
+            meta["lesson_order"] = order
 
-        # Associate with course (Security: quote all parameters)
-        self.cli.execute(
-            f'post meta update {shlex.quote(str(lesson_id))} {shlex.quote("course_id")} {shlex.quote(str(course_id))}'
-        )
-        self.cli.execute(
-            f'post meta update {shlex.quote(str(lesson_id))} {shlex.quote(f"ld_course_{course_id}")} {shlex.quote(str(course_id))}'
-        )
+        lesson_id = self._create_post("sfwd-lessons", title, status, content, meta)
 
-        # Set order if provided
-        if order is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(lesson_id))} {shlex.quote("lesson_order")} {shlex.quote(str(order))}'
-            )
+        # Seed the lesson->course map so create_topic never has to look
+        # this lesson up remotely
+        self._lesson_course[lesson_id] = course_id
 
+        self.invalidate_cache(course_id)
+        self._overview_invalidate(course_id)
         self.logger.info(f"Created lesson {lesson_id}: {title} for course {course_id}")
 
         return {
@@ -432,6 +825,11 @@ class LearnDashManager:
         """
         # Validate inputs
         lesson_id = self._validate_positive_int(lesson_id, "lesson_id")
+
+        # No fields supplied means nothing to do remotely
+        if title is None and content is None and order is None:
+            return {"id": lesson_id, "updated": False}
+
         if title is not None:
             title = self._validate_string(title, "title", max_length=200)
         if content is not None:
@@ -441,20 +839,23 @@ class LearnDashManager:
         if order is not None:
             order = self._validate_positive_int(order, "order")
 
-        updates = []
+        # Field and meta changes ride on one post update call
+        argv = ["post", "update", str(lesson_id)]
 
         if title:
-            updates.append(f'--post_title={shlex.quote(title)}')
+            argv.append(f'--post_title={title}')
         if content is not None:
-            updates.append(f'--post_content={shlex.quote(content)}')
-
-        if updates:
-            cmd = f'post update {shlex.quote(str(lesson_id))} {" ".join(updates)}'
-            self.cli.execute(cmd)
-
+            argv.append(f'--post_content={content}')
         if order is not None:
-            self.cli.execute(f'post meta update {shlex.quote(str(lesson_id))} {shlex.quote("lesson_order")} {shlex.quote(str(order))}')
+            argv.append(f'--meta_input={_jdumps({"lesson_order": order})}')
 
+        if len(argv) > 3:
+            self.cli.execute_argv(argv, format=None)
+
+        self.invalidate_cache(lesson_id)
+        # Lesson lists are keyed by course, which this method does not
+        # know; drop them all so a renamed/reordered lesson shows up
+        self._invalidate_kind("lessons")
         self.logger.info(f"Updated lesson {lesson_id}")
 
         return {"id": lesson_id, "updated": True}
@@ -475,8 +876,23 @@ class LearnDashManager:
         # Validate inputs
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        cmd = f'post list --post_type=sfwd-lessons --meta_key=course_id --meta_value={shlex.quote(str(course_id))} --orderby=menu_order --order=ASC'
-        return self.cli.execute(cmd, format="json")
+        key = ("lessons", course_id)
+        cached = self._cache_lookup(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        # Meta-filtered post lists degrade to full scans of wp_postmeta
+        # on large sites without a (meta_key, meta_value) index
+        self._ensure_postmeta_index()
+
+        # Listing only needs IDs/titles; skipping post_content keeps
+        # kilobytes of lesson body out of the pipe per row
+        cmd = (
+            f'post list --post_type=sfwd-lessons --meta_key=course_id '
+            f'--meta_value={shlex.quote(str(course_id))} --orderby=menu_order --order=ASC '
+            f'--fields=ID,post_title,post_status,menu_order'
+        )
+        return self._cache_store(key, self.cli.execute(cmd, format="json"))
 
     # ==================== QUIZ MANAGEMENT ====================
 
@@ -521,31 +937,19 @@ class LearnDashManager:
         if certificate_id is not None:
             certificate_id = self._validate_positive_int(certificate_id, "certificate_id")
 
-        cmd = f'post create --post_type=sfwd-quiz --post_title={shlex.quote(title)} --post_status=publish'
-
-        if description:
-            cmd += f' --post_content={shlex.quote(description)}'
-
-        result = self.cli.execute(cmd, format="json")
-        quiz_id = result if isinstance(result, int) else int(result)
-
-        # Set quiz meta (Security: quote all parameters)
-        self.cli.execute(f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("course_id")} {shlex.quote(str(course_id))}')
+        # LearnDash settings live in one serialized array under _sfwd-quiz
+        sfwd_settings = {"sfwd-quiz_passingpercentage": passing_score}
+        if certificate_id:
+            sfwd_settings["sfwd-quiz_certificate"] = certificate_id
 
+        meta = {
+            "course_id": course_id,
+            "_sfwd-quiz": sfwd_settings,
+        }
         if lesson_id:
-            self.cli.execute(f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("lesson_id")} {shlex.quote(str(lesson_id))}')
+            meta["lesson_id"] = lesson_id
 
-        # Set passing score
-        self.cli.execute(
-            f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("_sfwd-quiz")} '
-            f'{shlex.quote("_sfwd-quiz[sfwd-quiz_passingpercentage]")} {shlex.quote(str(passing_score))}'
-        )
-
-        if certificate_id:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("_sfwd-quiz")} '
-                f'{shlex.quote("_sfwd-quiz[sfwd-quiz_certificate]")} {shlex.quote(str(certificate_id))}'
-            )
+        quiz_id = self._create_post("sfwd-quiz", title, "publish", description, meta)
 
         self.logger.info(f"Created quiz {quiz_id}: {title} for course {course_id}")
 
@@ -594,37 +998,41 @@ class LearnDashManager:
         question_type = self._validate_literal(
             question_type,
             "question_type",
-            ["single", "multiple", "free_answer", "essay"]
+            self._QUESTION_TYPES,
         )
         points = self._validate_positive_int(points, "points")
 
-        cmd = f'post create --post_type=sfwd-question --post_title={shlex.quote(question_text)} --post_status=publish'
-
-        result = self.cli.execute(cmd, format="json")
-        question_id = result if isinstance(result, int) else int(result)
-
-        # Associate with quiz (Security: quote all parameters)
-        self.cli.execute(f'post meta update {shlex.quote(str(question_id))} {shlex.quote("quiz_id")} {shlex.quote(str(quiz_id))}')
-
-        # Set question type
-        type_map = {
-            "single": "single",
-            "multiple": "multiple",
-            "free_answer": "free_answer",
-            "essay": "essay_text",
+        meta = {
+            "quiz_id": quiz_id,
+            "question_type": self._QUESTION_TYPE_MAP[question_type],
+            "question_points": points,
         }
-        self.cli.execute(
-            f'post meta update {shlex.quote(str(question_id))} {shlex.quote("question_type")} {shlex.quote(type_map[question_type])}'
-        )
-
-        # Set points
-        self.cli.execute(f'post meta update {shlex.quote(str(question_id))} {shlex.quote("question_points")} {shlex.quote(str(points))}')
 
-        # Add answers if provided
+        # Pre-serialize the full answer set in Python so it rides along
+        # on the create call as one meta value: O(1) remote boots no
+        # matter how many answers the question has
         if answers and question_type in ["single", "multiple"]:
-            # Note: This is simplified - actual LearnDash uses complex serialized data
-            # For production, you'd need to properly serialize answer data
-            pass
+            answer_data = [
+                {
+                    "answer": str(a.get("text", "")),
+                    "correct": int(bool(a.get("correct", False))),
+                    "points": points,
+                }
+                for a in answers
+            ]
+            try:
+                meta["_answerData"] = self._serialize_php_array(answer_data)
+            except ValueError:
+                self.logger.warning(
+                    "phpserialize not installed; answers were not attached "
+                    f"to question for quiz {quiz_id}"
+                )
+
+        # Quiz association, type, points and answers ride along on the
+        # create call
+        question_id = self._create_post(
+            "sfwd-question", question_text, "publish", meta=meta
+        )
 
         self.logger.info(f"Added question {question_id} to quiz {quiz_id}")
 
@@ -656,15 +1064,15 @@ class LearnDashManager:
         user_id = self._validate_positive_int(user_id, "user_id")
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        # LearnDash stores enrollments in user meta (Security: quote all parameters)
-        self.cli.execute(
-            f'user meta add {shlex.quote(str(user_id))} {shlex.quote(f"course_enrolled_{course_id}")} {shlex.quote(str(course_id))}'
+        # LearnDash stores enrollments on both the user and the course;
+        # one eval does both writes in a single WordPress bootstrap
+        # (IDs are validated ints, so interpolation is safe)
+        self.cli.execute_php(
+            f'add_user_meta({user_id}, "course_enrolled_{course_id}", {course_id});'
+            f' add_post_meta({course_id}, "learndash_course_users", {user_id});'
         )
 
-        # Also update course user list
-        cmd = f'post meta add {shlex.quote(str(course_id))} {shlex.quote("learndash_course_users")} {shlex.quote(str(user_id))}'
-        self.cli.execute(cmd)
-
+        self.invalidate_cache(user_id)
         self.logger.info(f"Enrolled user {user_id} in course {course_id}")
 
         return {
@@ -691,13 +1099,13 @@ class LearnDashManager:
         user_id = self._validate_positive_int(user_id, "user_id")
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        self.cli.execute(
-            f'user meta delete {shlex.quote(str(user_id))} {shlex.quote(f"course_enrolled_{course_id}")}'
-        )
-        self.cli.execute(
-            f'post meta delete {shlex.quote(str(course_id))} {shlex.quote("learndash_course_users")} {shlex.quote(str(user_id))}'
+        # Both meta deletes in one WordPress bootstrap
+        self.cli.execute_php(
+            f'delete_user_meta({user_id}, "course_enrolled_{course_id}");'
+            f' delete_post_meta({course_id}, "learndash_course_users", {user_id});'
         )
 
+        self.invalidate_cache(user_id)
         self.logger.info(f"Unenrolled user {user_id} from course {course_id}")
 
         return {
@@ -722,22 +1130,74 @@ class LearnDashManager:
         # Validate inputs
         user_id = self._validate_positive_int(user_id, "user_id")
 
-        # Get all user meta keys starting with course_enrolled_
-        cmd = f'user meta list {shlex.quote(str(user_id))} --fields=meta_key,meta_value'
-        meta = self.cli.execute(cmd, format="json")
+        key = ("user_courses", user_id)
+        cached = self._cache_lookup(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        # Filter the meta keys remotely so only enrollment/completion
+        # markers cross the pipe; power users carry hundreds of
+        # unrelated meta rows that would otherwise be serialized,
+        # transferred and parsed just to be discarded here
+        php = (
+            f"$out = array(); "
+            f"foreach (get_user_meta({user_id}) as $k => $v) {{ "
+            "if (strpos($k, 'course_enrolled_') === 0 "
+            "|| strpos($k, 'course_completed_') === 0 "
+            "|| strpos($k, 'learndash_course_progress_') === 0) { "
+            "$out[$k] = $v[0]; } } "
+            "echo json_encode($out);"
+        )
+        raw = self.cli.execute_php(php)
+        try:
+            meta_map = _jloads(str(raw))
+        except ValueError:  # covers json and orjson decode errors
+            self.logger.warning(f"Unexpected meta filter output for user {user_id}")
+            meta_map = {}
+        if not isinstance(meta_map, dict):
+            meta_map = {}
 
         course_ids = [
-            int(m['meta_value'])
-            for m in meta
-            if m['meta_key'].startswith('course_enrolled_')
+            int(value)
+            for meta_key, value in meta_map.items()
+            if meta_key.startswith('course_enrolled_')
         ]
+        if not course_ids:
+            return self._cache_store(key, [])
+
+        completed_ids = {
+            int(meta_key.removeprefix('course_completed_'))
+            for meta_key in meta_map
+            if meta_key.startswith('course_completed_')
+            and meta_key.removeprefix('course_completed_').isdigit()
+        }
+        in_progress_ids = {
+            int(meta_key.removeprefix('learndash_course_progress_'))
+            for meta_key in meta_map
+            if meta_key.startswith('learndash_course_progress_')
+            and meta_key.removeprefix('learndash_course_progress_').isdigit()
+        }
 
-        courses = []
-        for cid in course_ids:
-            course_data = self.cli.get_post(cid)
-            courses.append(course_data)
+        # One post list for all courses instead of a get_post per course;
+        # posts_per_page=-1 keeps long enrollment lists from being capped
+        courses = self.cli.execute_argv(
+            [
+                "post",
+                "list",
+                f"--post__in={','.join(str(cid) for cid in course_ids)}",
+                "--post_type=sfwd-courses",
+                "--posts_per_page=-1",
+                "--fields=ID,post_title,post_status,post_date",
+            ],
+            format="json",
+        )
 
-        return courses
+        for course in courses:
+            cid = int(course["ID"])
+            course["completed"] = cid in completed_ids
+            course["in_progress"] = cid not in completed_ids and cid in in_progress_ids
+
+        return self._cache_store(key, courses)
 
     def get_course_students(self, course_id: int) -> list[dict]:
         """
@@ -747,7 +1207,7 @@ class LearnDashManager:
             course_id: Course post ID
 
         Returns:
-            List of enrolled users
+            List of dicts with user_id, username, email, display_name
 
         Raises:
             ValueError: If input validation fails
@@ -755,12 +1215,39 @@ class LearnDashManager:
         # Validate inputs
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        cmd = f'post meta get {shlex.quote(str(course_id))} {shlex.quote("learndash_course_users")}'
-        user_ids = self.cli.execute(cmd)
+        # Unserialize the user list and resolve user records in-PHP:
+        # one remote round trip, and callers get a typed list instead
+        # of a raw serialized blob to re-parse. enroll_user stores one
+        # meta row per user, so fetch every row (third arg false) and
+        # flatten — a single=true read would return only the first row
+        php = (
+            f'$uids = array();'
+            f' foreach (get_post_meta({course_id}, "learndash_course_users", false) as $row) {{'
+            ' if (is_array($row)) { foreach ($row as $v) { $uids[] = (int) $v; } }'
+            ' else { $uids[] = (int) $row; }'
+            ' }'
+            ' $uids = array_values(array_unique(array_filter($uids)));'
+            ' $out = array();'
+            ' if ($uids) {'
+            ' foreach (get_users(array("include" => $uids)) as $u) {'
+            ' $out[] = array("user_id" => (int) $u->ID,'
+            ' "username" => $u->user_login,'
+            ' "email" => $u->user_email,'
+            ' "display_name" => $u->display_name);'
+            ' } }'
+            ' echo json_encode($out);'
+        )
+        result = self.cli.execute_php(php)
+
+        try:
+            students = _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
+            self.logger.warning(
+                f"Could not parse student list for course {course_id}"
+            )
+            return []
 
-        # Parse serialized data if needed (LearnDash stores as serialized array)
-        # For now, return raw data - would need parsing in production
-        return {"user_ids": user_ids, "course_id": course_id}
+        return students if isinstance(students, list) else []
 
     # ==================== GROUP MANAGEMENT ====================
 
@@ -797,20 +1284,13 @@ class LearnDashManager:
                 for i, cid in enumerate(course_ids)
             ]
 
-        cmd = f'post create --post_type=groups --post_title={shlex.quote(title)} --post_status=publish'
-
-        if description:
-            cmd += f' --post_content={shlex.quote(description)}'
-
-        result = self.cli.execute(cmd, format="json")
-        group_id = result if isinstance(result, int) else int(result)
-
-        # Associate courses (Security: quote all parameters)
-        if course_ids:
-            for course_id in course_ids:
-                self.cli.execute(
-                    f'post meta add {shlex.quote(str(group_id))} {shlex.quote(f"learndash_group_enrolled_{course_id}")} {shlex.quote(str(course_id))}'
-                )
+        # Course associations ride along on the create call
+        meta = {
+            f"learndash_group_enrolled_{cid}": cid for cid in (course_ids or [])
+        }
+        group_id = self._create_post(
+            "groups", title, "publish", description, meta or None
+        )
 
         self.logger.info(f"Created group {group_id}: {title}")
 
@@ -839,11 +1319,10 @@ class LearnDashManager:
         user_id = self._validate_positive_int(user_id, "user_id")
         group_id = self._validate_positive_int(group_id, "group_id")
 
-        self.cli.execute(
-            f'user meta add {shlex.quote(str(user_id))} {shlex.quote(f"learndash_group_users_{group_id}")} {shlex.quote(str(group_id))}'
-        )
-        self.cli.execute(
-            f'post meta add {shlex.quote(str(group_id))} {shlex.quote("learndash_group_users")} {shlex.quote(str(user_id))}'
+        # Both membership meta writes in one WordPress bootstrap
+        self.cli.execute_php(
+            f'add_user_meta({user_id}, "learndash_group_users_{group_id}", {group_id});'
+            f' add_post_meta({group_id}, "learndash_group_users", {user_id});'
         )
 
         self.logger.info(f"Added user {user_id} to group {group_id}")
@@ -918,35 +1397,31 @@ class LearnDashManager:
             content = self._validate_string(
                 content, "content", max_length=50000, allow_empty=True
             )
-        status = self._validate_literal(status, "status", ["publish", "draft"])
+        status = self._validate_literal(status, "status", self._CONTENT_STATUSES)
         if order is not None:
             order = self._validate_positive_int(order, "order")
 
-        cmd = f'post create --post_type=sfwd-topic --post_title={shlex.quote(title)} --post_status={status}'
-
-        if content:
-            cmd += f' --post_content={shlex.quote(content)}'
-
-        result = self.cli.execute(cmd, format="json")
-        topic_id = result if isinstance(result, int) else int(result)
-
-        # Get course ID from lesson
-        lesson_data = self.cli.get_post(lesson_id)
-        course_id = None
-        if lesson_data and 'meta' in lesson_data:
-            course_id = lesson_data['meta'].get('course_id')
-
-        # Associate with lesson and course (Security: quote all parameters)
-        self.cli.execute(f'post meta update {shlex.quote(str(topic_id))} {shlex.quote("lesson_id")} {shlex.quote(str(lesson_id))}')
-
+        # Get course ID from lesson first so every association can ride
+        # along on the create call as --meta_input; the memo avoids one
+        # remote post fetch per topic when bulk-creating under a lesson
+        course_id = self._lesson_course.get(lesson_id)
+        if course_id is None:
+            lesson_data = self.cli.get_post(lesson_id)
+            if lesson_data and 'meta' in lesson_data:
+                course_id = lesson_data['meta'].get('course_id')
+            if course_id:
+                self._lesson_course[lesson_id] = int(course_id)
+
+        meta = {"lesson_id": lesson_id}
         if course_id:
-            self.cli.execute(f'post meta update {shlex.quote(str(topic_id))} {shlex.quote("course_id")} {shlex.quote(str(course_id))}')
-            self.cli.execute(f'post meta update {shlex.quote(str(topic_id))} {shlex.quote(f"ld_course_{course_id}")} {shlex.quote(str(course_id))}')
-
-        # Set order if provided
+            meta["course_id"] = course_id
+            meta[f"ld_course_{course_id}"] = course_id
         if order is not None:
-            self.cli.execute(f'post meta update {shlex.quote(str(topic_id))} {shlex.quote("topic_order")} {shlex.quote(str(order))}')
+            meta["topic_order"] = order
 
+        topic_id = self._create_post("sfwd-topic", title, status, content, meta)
+
+        self.invalidate_cache(lesson_id)
         self.logger.info(f"Created topic {topic_id}: {title} for lesson {lesson_id}")
 
         return {
@@ -974,8 +1449,17 @@ class LearnDashManager:
         # Validate inputs
         lesson_id = self._validate_positive_int(lesson_id, "lesson_id")
 
-        cmd = f'post list --post_type=sfwd-topic --meta_key=lesson_id --meta_value={shlex.quote(str(lesson_id))} --orderby=menu_order --order=ASC'
-        return self.cli.execute(cmd, format="json")
+        key = ("topics", lesson_id)
+        cached = self._cache_lookup(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        cmd = (
+            f'post list --post_type=sfwd-topic --meta_key=lesson_id '
+            f'--meta_value={shlex.quote(str(lesson_id))} --orderby=menu_order --order=ASC '
+            f'--fields=ID,post_title,post_status,menu_order'
+        )
+        return self._cache_store(key, self.cli.execute(cmd, format="json"))
 
     def update_topic(
         self,
@@ -1012,24 +1496,27 @@ class LearnDashManager:
         if order is not None:
             order = self._validate_positive_int(order, "order")
         if status is not None:
-            status = self._validate_literal(status, "status", ["publish", "draft"])
+            status = self._validate_literal(status, "status", self._CONTENT_STATUSES)
 
-        updates = []
+        # Field and meta changes ride on one post update call
+        argv = ["post", "update", str(topic_id)]
 
         if title:
-            updates.append(f'--post_title={shlex.quote(title)}')
+            argv.append(f'--post_title={title}')
         if content is not None:
-            updates.append(f'--post_content={shlex.quote(content)}')
+            argv.append(f'--post_content={content}')
         if status:
-            updates.append(f'--post_status={status}')
-
-        if updates:
-            cmd = f'post update {shlex.quote(str(topic_id))} {" ".join(updates)}'
-            self.cli.execute(cmd)
-
+            argv.append(f'--post_status={status}')
         if order is not None:
-            self.cli.execute(f'post meta update {shlex.quote(str(topic_id))} {shlex.quote("topic_order")} {shlex.quote(str(order))}')
+            argv.append(f'--meta_input={_jdumps({"topic_order": order})}')
 
+        if len(argv) > 3:
+            self.cli.execute_argv(argv, format=None)
+
+        self.invalidate_cache(topic_id)
+        # Topic lists are keyed by lesson, which this method does not
+        # know; drop them all so a renamed/reordered topic shows up
+        self._invalidate_kind("topics")
         self.logger.info(f"Updated topic {topic_id}")
 
         return {"id": topic_id, "updated": True}
@@ -1090,25 +1577,32 @@ class LearnDashManager:
             cmd = f'post update {shlex.quote(str(quiz_id))} {" ".join(updates)}'
             self.cli.execute(cmd)
 
-        # Update LearnDash quiz meta (Security: quote all parameters)
+        # Update LearnDash quiz meta. The settings live inside the
+        # serialized _sfwd-quiz array, which the flat-key `post meta
+        # update` syntax cannot address, so read-merge-write the array
+        # in one PHP boot (values are validated ints)
+        quiz_settings = {}
         if passing_score is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("_sfwd-quiz")} '
-                f'{shlex.quote("_sfwd-quiz[sfwd-quiz_passingpercentage]")} {shlex.quote(str(passing_score))}'
-            )
-
+            quiz_settings["sfwd-quiz_passingpercentage"] = passing_score
         if quiz_attempts is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("_sfwd-quiz")} '
-                f'{shlex.quote("_sfwd-quiz[sfwd-quiz_repeats]")} {shlex.quote(str(quiz_attempts))}'
-            )
-
+            quiz_settings["sfwd-quiz_repeats"] = quiz_attempts
         if time_limit is not None:
-            self.cli.execute(
-                f'post meta update {shlex.quote(str(quiz_id))} {shlex.quote("_sfwd-quiz")} '
-                f'{shlex.quote("_sfwd-quiz[sfwd-quiz_time_limit]")} {shlex.quote(str(time_limit))}'
+            quiz_settings["sfwd-quiz_time_limit"] = time_limit
+
+        if quiz_settings:
+            assigns = " ".join(
+                f'$s["{key}"] = "{value}";'
+                for key, value in quiz_settings.items()
             )
+            php = (
+                f'$s = get_post_meta({quiz_id}, "_sfwd-quiz", true); '
+                'if (!is_array($s)) { $s = array(); } '
+                f'{assigns} '
+                f'update_post_meta({quiz_id}, "_sfwd-quiz", $s);'
+            )
+            self.cli.execute_php(php)
 
+        self.invalidate_cache(quiz_id)
         self.logger.info(f"Updated quiz {quiz_id}")
 
         return {"success": True, "id": quiz_id, "action": "updated", "data": {"updated": True}}
@@ -1175,6 +1669,7 @@ class LearnDashManager:
             self.cli.execute(f'post update {shlex.quote(str(lesson_id))} --menu_order={shlex.quote(str(menu_order))}')
             self.logger.info(f"Set lesson {lesson_id} to position {menu_order}")
 
+        self.invalidate_cache(course_id)
         self.logger.info(f"Reordered {len(validated_lessons)} lessons in course {course_id}")
 
         return {
@@ -1244,6 +1739,7 @@ class LearnDashManager:
             self.cli.execute(f'post update {shlex.quote(str(topic_id))} --menu_order={shlex.quote(str(menu_order))}')
             self.logger.info(f"Set topic {topic_id} to position {menu_order}")
 
+        self.invalidate_cache(lesson_id)
         self.logger.info(f"Reordered {len(validated_topics)} topics in lesson {lesson_id}")
 
         return {
@@ -1313,6 +1809,11 @@ class LearnDashManager:
         if new_order is not None:
             self.cli.execute(f'post meta update {shlex.quote(str(lesson_id))} {shlex.quote("lesson_order")} {shlex.quote(str(new_order))}')
 
+        self.invalidate_cache(lesson_id)
+        self.invalidate_cache(from_course_id)
+        self.invalidate_cache(to_course_id)
+        self._overview_invalidate(from_course_id)
+        self._overview_invalidate(to_course_id)
         self.logger.info(
             f"Moved lesson {lesson_id} from course {from_course_id} to course {to_course_id}"
         )
@@ -1600,6 +2101,7 @@ class LearnDashManager:
             self.cli.execute(f'post meta delete {shlex.quote(str(lesson_id))} {shlex.quote("lesson_prerequisite")}')
             self.cli.execute(f'post meta delete {shlex.quote(str(lesson_id))} {shlex.quote("lesson_prerequisites")}')
 
+        self.invalidate_cache(lesson_id)
         self.logger.info(
             f"Set {len(validated_prerequisites)} prerequisites for lesson {lesson_id}"
         )
@@ -1700,7 +2202,7 @@ class LearnDashManager:
         # LearnDash uses a complex serialized structure
         # For now, we'll store as JSON in a custom meta field
         import json
-        structure_json = json.dumps(structure)
+        structure_json = _jdumps(structure)
 
         self.cli.execute(
             f'post meta update {shlex.quote(str(course_id))} {shlex.quote("ld_course_builder")} {shlex.quote(structure_json)}'
@@ -1753,25 +2255,31 @@ class LearnDashManager:
         user_id = self._validate_positive_int(user_id, "user_id")
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        # Get user course progress meta (Security: quote all parameters)
-        cmd = f'user meta get {shlex.quote(str(user_id))} {shlex.quote(f"course_progress_{course_id}")}'
-        progress_data = self.cli.execute(cmd)
-
-        # Get completed lessons
+        # One meta list covers everything: the course progress blob,
+        # completed lessons, and quiz attempts all come out of the same
+        # rows, so the dedicated `user meta get` round trip is redundant
         cmd = f'user meta list {shlex.quote(str(user_id))} --fields=meta_key,meta_value'
         all_meta = self.cli.execute(cmd, format="json")
 
-        completed_lessons = [
-            int(m['meta_value'])
-            for m in all_meta
-            if m['meta_key'].startswith(f'course_{course_id}_lesson_') and m['meta_key'].endswith('_completed')
-        ]
-
-        # Get quiz attempts
-        quiz_attempts = [
-            m for m in all_meta
-            if 'quiz_' in m['meta_key'] and 'attempt_' in m['meta_key']
-        ]
+        progress_key = f'course_progress_{course_id}'
+        # One compiled pattern replaces the startswith/endswith pair;
+        # the regex prefix scan rejects non-matching rows in C
+        lesson_match = re.compile(
+            rf'^course_{course_id}_lesson_\d+_completed$'
+        ).match
+        progress_data = None
+        completed_lessons = []
+        quiz_attempts = []
+        completed_append = completed_lessons.append
+        attempts_append = quiz_attempts.append
+        for m in all_meta:
+            key = m['meta_key']
+            if key == progress_key:
+                progress_data = m['meta_value']
+            elif lesson_match(key):
+                completed_append(int(m['meta_value']))
+            elif 'quiz_' in key and 'attempt_' in key:
+                attempts_append(m)
 
         # Calculate completion percentage
         lessons = self.list_course_lessons(course_id)
@@ -1794,6 +2302,9 @@ class LearnDashManager:
         """
         Get completion statistics for a course.
 
+        Enrollment and completion counts come from one SQL query over
+        wp_usermeta instead of per-student user meta round trips.
+
         Args:
             course_id: Course post ID
 
@@ -1806,22 +2317,69 @@ class LearnDashManager:
         # Validate inputs
         course_id = self._validate_positive_int(course_id, "course_id")
 
-        # Get all enrolled users (Security: quote all parameters)
-        cmd = f'post meta get {shlex.quote(str(course_id))} {shlex.quote("learndash_course_users")}'
-        enrolled_users_data = self.cli.execute(cmd)
+        # Tally enrollments, completions and in-progress markers for all
+        # users in one round trip; only key presence crosses the pipe,
+        # never the meta value payloads (timestamps, serialized arrays)
+        query = (
+            f"SELECT SUM(meta_key = 'course_enrolled_{course_id}'), "
+            f"SUM(meta_key = 'course_completed_{course_id}'), "
+            f"SUM(meta_key = 'learndash_course_progress_{course_id}') "
+            f"FROM wp_usermeta WHERE meta_key IN "
+            f"('course_enrolled_{course_id}', 'course_completed_{course_id}', "
+            f"'learndash_course_progress_{course_id}')"
+        )
+        cmd = f'db query {shlex.quote(query)} --skip-column-names'
+        result = self.cli.execute(cmd, format=None)
+
+        enrolled_users = completed_users = progress_rows = 0
+        if result:
+            parts = str(result).split()
+            if len(parts) >= 2 and parts[0] != 'NULL':
+                enrolled_users = int(parts[0])
+                completed_users = int(parts[1])
+            if len(parts) >= 3 and parts[2] != 'NULL':
+                progress_rows = int(parts[2])
+
+        # Short-circuit empty courses: no enrollments means every derived
+        # stat is zero, so skip the breakdown math and division guard
+        if enrolled_users == 0:
+            total_lessons = self._overview_lesson_count(course_id)
+            if total_lessons is None:
+                total_lessons = len(self.list_course_lessons(course_id))
+                self._overview_store(course_id, lesson_count=total_lessons)
+            return {
+                "course_id": course_id,
+                "total_lessons": total_lessons,
+                "enrolled_users": 0,
+                "completed_users": 0,
+                "in_progress_users": 0,
+                "not_started_users": 0,
+                "completion_rate": 0.0,
+            }
+
+        # Users with a progress row but no completion marker are mid-course
+        in_progress_users = max(progress_rows - completed_users, 0)
+        not_started_users = max(enrolled_users - completed_users - in_progress_users, 0)
 
-        # Parse user IDs (this might be serialized data)
-        # For now, we'll return raw data with explanation
+        # Lesson count comes from the local overview cache when warm;
+        # only a miss costs a wp-cli round trip
+        total_lessons = self._overview_lesson_count(course_id)
+        if total_lessons is None:
+            total_lessons = len(self.list_course_lessons(course_id))
+            self._overview_store(course_id, lesson_count=total_lessons)
 
-        # Get course lessons count
-        lessons = self.list_course_lessons(course_id)
-        total_lessons = len(lessons)
+        completion_rate = (
+            round(completed_users / enrolled_users * 100, 2) if enrolled_users else 0.0
+        )
 
         return {
             "course_id": course_id,
             "total_lessons": total_lessons,
-            "enrolled_users_data": enrolled_users_data,
-            "note": "enrolled_users_data may contain serialized PHP array - parse accordingly",
+            "enrolled_users": enrolled_users,
+            "completed_users": completed_users,
+            "in_progress_users": in_progress_users,
+            "not_started_users": not_started_users,
+            "completion_rate": completion_rate,
         }
 
     def get_group_progress(self, group_id: int) -> dict:
@@ -1840,27 +2398,87 @@ class LearnDashManager:
         # Validate inputs
         group_id = self._validate_positive_int(group_id, "group_id")
 
-        # Get group users (Security: quote all parameters)
-        cmd = f'post meta get {shlex.quote(str(group_id))} {shlex.quote("learndash_group_users")}'
-        group_users_data = self.cli.execute(cmd)
+        # Fetch every member row: add_user_to_group and the bulk path
+        # write one learndash_group_users row per member, so a
+        # single-row `post meta get` would report at most one user
+        sql = (
+            "SELECT meta_value FROM wp_postmeta "
+            f"WHERE post_id = {group_id} AND meta_key = 'learndash_group_users'"
+        )
+        raw_members = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
 
-        # Get associated courses
-        cmd = f'post meta list {shlex.quote(str(group_id))} --fields=meta_key,meta_value'
-        group_meta = self.cli.execute(cmd, format="json")
+        # Rows hold either a serialized PHP array or a bare member ID;
+        # parse here (microseconds, in-process) so callers get real IDs
+        # instead of shelling out again to unserialize
+        user_ids: list[int] = []
+        for row in str(raw_members).splitlines():
+            parsed = self._unserialize_php(row)
+            if isinstance(parsed, dict):
+                user_ids.extend(int(uid) for uid in parsed.values())
+            elif isinstance(parsed, list):
+                user_ids.extend(int(uid) for uid in parsed)
+            elif row.strip().isdigit():
+                user_ids.append(int(row.strip()))
+        user_ids = list(dict.fromkeys(user_ids))
+
+        # Get associated courses with one indexed SELECT instead of
+        # listing every meta row and filtering by prefix in Python
+        sql = (
+            "SELECT REPLACE(meta_key, 'learndash_group_enrolled_', '') "
+            f"FROM wp_postmeta WHERE post_id = {group_id} "
+            "AND meta_key LIKE 'learndash_group_enrolled_%'"
+        )
+        raw = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
 
         course_ids = [
-            int(m['meta_value'])
-            for m in group_meta
-            if m['meta_key'].startswith('learndash_group_enrolled_')
+            int(line) for line in str(raw).split() if line.isdigit()
         ]
 
         return {
             "group_id": group_id,
             "associated_courses": course_ids,
-            "group_users_data": group_users_data,
-            "note": "group_users_data may contain serialized PHP array - parse accordingly",
+            "user_ids": user_ids,
+            "member_count": len(user_ids),
         }
 
+    def bulk_group_progress(self, group_ids: list[int]) -> list[dict]:
+        """
+        Get progress statistics for many groups in parallel.
+
+        Fans out across a process pool: each worker holds its own SSH
+        connection, so the remote WordPress bootstraps overlap and the
+        Python-side parsing runs outside the GIL.
+
+        Args:
+            group_ids: Group post IDs
+
+        Returns:
+            get_group_progress() results in the same order as group_ids
+
+        Raises:
+            ValueError: If input validation fails
+        """
+        if not isinstance(group_ids, list):
+            raise ValueError("group_ids must be a list")
+        if not group_ids:
+            raise ValueError("group_ids cannot be empty")
+        group_ids = [
+            self._validate_positive_int(gid, "group_id") for gid in group_ids
+        ]
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(
+                pool.map(
+                    _compute_group_progress,
+                    repeat(asdict(self.config)),
+                    group_ids,
+                )
+            )
+
     # ==================== BULK OPERATIONS ====================
 
     def bulk_enroll_users(self, user_ids: list[int], course_id: int) -> dict:
@@ -1895,48 +2513,25 @@ class LearnDashManager:
             "aborted": False,
         }
 
-        consecutive_failures = 0
-        MAX_CONSECUTIVE_FAILURES = 5
-
-        for i, user_id in enumerate(user_ids):
-            try:
-                # Validate this user_id
-                user_id = self._validate_positive_int(user_id, f"user_ids[{i}]")
-
-                # Attempt enrollment
-                result = self.enroll_user(user_id, course_id)
-                if result.get("enrolled"):
-                    results["enrolled"] += 1
-                    consecutive_failures = 0
-                else:
-                    results["failed"] += 1
-                    results["errors"].append({
-                        "user_id": user_id,
-                        "error": result.get("error", "Unknown error")
-                    })
-                    consecutive_failures += 1
-
-            except ValueError as e:
-                # Validation error
-                self.logger.error(f"Validation error for user {user_id}: {e}")
-                results["failed"] += 1
-                results["errors"].append({"user_id": user_id, "error": str(e)})
-                consecutive_failures += 1
-
-            except Exception as e:
-                # Other errors
-                self.logger.error(f"Failed to enroll user {user_id}: {e}")
-                results["failed"] += 1
-                results["errors"].append({"user_id": user_id, "error": str(e)})
-                consecutive_failures += 1
+        valid_ids = self._validate_bulk_user_ids(user_ids, results)
+
+        # Write the same marker meta enroll_user writes: every reader in
+        # this module (get_user_courses, completion rate, the report
+        # helpers) queries course_enrolled_*/learndash_course_users, and
+        # ld_update_course_access alone does not produce those rows
+        self._bulk_eval_user_op(
+            valid_ids,
+            php_call=(
+                f"ld_update_course_access($u, {course_id}, false); "
+                f'add_user_meta($u, "course_enrolled_{course_id}", {course_id}); '
+                f'add_post_meta({course_id}, "learndash_course_users", $u)'
+            ),
+            results=results,
+            success_key="enrolled",
+        )
 
-            # Circuit breaker: abort if too many consecutive failures
-            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                self.logger.error(
-                    f"Aborting bulk enrollment after {MAX_CONSECUTIVE_FAILURES} consecutive failures"
-                )
-                results["aborted"] = True
-                break
+        if results["enrolled"]:
+            self.invalidate_cache()
 
         self.logger.info(
             f"Bulk enrollment completed: {results['enrolled']} enrolled, "
@@ -1977,55 +2572,136 @@ class LearnDashManager:
             "aborted": False,
         }
 
-        consecutive_failures = 0
-        MAX_CONSECUTIVE_FAILURES = 5
+        valid_ids = self._validate_bulk_user_ids(user_ids, results)
+
+        self._bulk_eval_user_op(
+            valid_ids,
+            # Same marker meta add_user_to_group writes, so bulk-added
+            # members show up in group progress and membership reads
+            php_call=(
+                f"ld_update_group_access($u, {group_id}, false); "
+                f'add_user_meta($u, "learndash_group_users_{group_id}", {group_id}); '
+                f'add_post_meta({group_id}, "learndash_group_users", $u)'
+            ),
+            results=results,
+            success_key="added",
+        )
+
+        if results["added"]:
+            self.invalidate_cache()
 
+        self.logger.info(
+            f"Bulk group addition completed: {results['added']} added, "
+            f"{results['failed']} failed, aborted={results['aborted']}"
+        )
+
+        return results
+
+    def _validate_bulk_user_ids(self, user_ids: list, results: dict) -> list[int]:
+        """Validate user IDs for a bulk operation, recording failures in results."""
+        # Track in locals and write back once; per-iteration dict writes
+        # add up when validating very large ID lists
+        valid_ids = []
+        failed = 0
+        errors = []
         for i, user_id in enumerate(user_ids):
             try:
-                # Validate this user_id
-                user_id = self._validate_positive_int(user_id, f"user_ids[{i}]")
-
-                # Attempt to add to group
-                result = self.add_user_to_group(user_id, group_id)
-                if result.get("added"):
-                    results["added"] += 1
-                    consecutive_failures = 0
-                else:
-                    results["failed"] += 1
-                    results["errors"].append({
-                        "user_id": user_id,
-                        "error": result.get("error", "Unknown error")
-                    })
-                    consecutive_failures += 1
-
+                valid_ids.append(self._validate_positive_int(user_id, f"user_ids[{i}]"))
             except ValueError as e:
-                # Validation error
                 self.logger.error(f"Validation error for user {user_id}: {e}")
-                results["failed"] += 1
-                results["errors"].append({"user_id": user_id, "error": str(e)})
-                consecutive_failures += 1
+                failed += 1
+                errors.append({"user_id": user_id, "error": str(e)})
+        results["failed"] += failed
+        results["errors"].extend(errors)
+        return valid_ids
+
+    def _bulk_eval_user_op(
+        self,
+        user_ids: list[int],
+        php_call: str,
+        results: dict,
+        success_key: str,
+    ) -> None:
+        """
+        Apply a per-user LearnDash PHP call to many users via batched `wp eval`.
+
+        Instead of shelling out once per user, users are processed in chunks of
+        BULK_EVAL_CHUNK: each chunk runs a single PHP loop remotely and echoes a
+        JSON map of user_id -> true (success) or an error message. When the batch
+        spans several chunks they run concurrently (the evals are independent,
+        each blocked on its own remote PHP boot); a failed chunk marks the batch
+        aborted, though chunks already in flight still have their results counted.
+        """
+        chunks = [
+            user_ids[start:start + self.BULK_EVAL_CHUNK]
+            for start in range(0, len(user_ids), self.BULK_EVAL_CHUNK)
+        ]
 
+        def run(chunk: list[int]):
+            try:
+                return self._eval_user_chunk(chunk, php_call), None
             except Exception as e:
-                # Other errors
-                self.logger.error(f"Failed to add user {user_id} to group: {e}")
-                results["failed"] += 1
-                results["errors"].append({"user_id": user_id, "error": str(e)})
-                consecutive_failures += 1
+                return None, e
 
-            # Circuit breaker: abort if too many consecutive failures
-            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                self.logger.error(
-                    f"Aborting bulk group addition after {MAX_CONSECUTIVE_FAILURES} consecutive failures"
-                )
+        if len(chunks) == 1:
+            pairs = [run(chunks[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.REPORT_WORKERS, len(chunks))
+            ) as pool:
+                pairs = list(pool.map(run, chunks))
+
+        for chunk, (outcome, error) in zip(chunks, pairs):
+            if error is not None:
+                self.logger.error(f"Bulk eval chunk failed: {error}")
+                results["failed"] += len(chunk)
+                results["errors"].append({"user_ids": chunk, "error": str(error)})
                 results["aborted"] = True
-                break
-
-        self.logger.info(
-            f"Bulk group addition completed: {results['added']} added, "
-            f"{results['failed']} failed, aborted={results['aborted']}"
+                continue
+
+            succeeded = 0
+            failed = 0
+            errors = []
+            for uid in chunk:
+                status = outcome.get(str(uid), outcome.get(uid))
+                if status is True:
+                    succeeded += 1
+                else:
+                    failed += 1
+                    errors.append({
+                        "user_id": uid,
+                        "error": status if isinstance(status, str) else "Unknown error",
+                    })
+            results[success_key] += succeeded
+            results["failed"] += failed
+            results["errors"].extend(errors)
+
+    def _eval_user_chunk(self, chunk: list[int], php_call: str) -> dict:
+        """Run one bulk-eval chunk and return its user_id -> status map."""
+        ids_php = ",".join(str(uid) for uid in chunk)
+        # Defer term/comment counting and cache invalidation for the
+        # duration of the loop: per-write hook costs are paid once per
+        # chunk instead of once per user (counts recompute on re-enable)
+        php = (
+            "wp_defer_term_counting(true); "
+            "wp_defer_comment_counting(true); "
+            "wp_suspend_cache_invalidation(true); "
+            "$r = array(); "
+            f"foreach (array({ids_php}) as $u) {{ "
+            f"try {{ {php_call}; $r[$u] = true; }} "
+            "catch (Throwable $e) { $r[$u] = $e->getMessage(); } } "
+            "wp_suspend_cache_invalidation(false); "
+            "wp_defer_term_counting(false); "
+            "wp_defer_comment_counting(false); "
+            "echo json_encode($r);"
         )
-
-        return results
+        # execute_php streams oversized scripts to `wp eval-file -`, so a
+        # full 500-ID chunk never hits shell argument limits
+        raw = self.cli.execute_php(php)
+        outcome = raw if isinstance(raw, dict) else _jloads(str(raw))
+        if not isinstance(outcome, dict):
+            raise ValueError(f"unexpected eval output: {raw!r}")
+        return outcome
 
     # ==================== QUIZ STATISTICS ====================
 
@@ -2080,12 +2756,16 @@ class LearnDashManager:
         cmd = 'post list --post_type=sfwd-certificates --post_status=publish'
         return self.cli.execute(cmd, format="json")
 
-    def get_user_certificates(self, user_id: int) -> list[dict]:
+    def get_user_certificates(
+        self, user_id: int, course_id: Optional[int] = None
+    ) -> list[dict]:
         """
-        Get all certificates earned by a user.
+        Get certificates earned by a user.
 
         Args:
             user_id: WordPress user ID
+            course_id: Limit to one course (single meta read instead of
+                scanning every meta row)
 
         Returns:
             List of earned certificates with course/quiz associations
@@ -2096,25 +2776,61 @@ class LearnDashManager:
         # Validate inputs
         user_id = self._validate_positive_int(user_id, "user_id")
 
-        # Get user meta for certificates (Security: quote all parameters)
-        cmd = f'user meta list {shlex.quote(str(user_id))} --fields=meta_key,meta_value'
-        all_meta = self.cli.execute(cmd, format="json")
+        if course_id is not None:
+            # Short path: one targeted meta read instead of listing all
+            # user meta and filtering in Python
+            course_id = self._validate_positive_int(course_id, "course_id")
+            cmd = (
+                f'user meta get {shlex.quote(str(user_id))} '
+                f'{shlex.quote(f"course_completed_{course_id}")}'
+            )
+            try:
+                completed_at = self.cli.execute(cmd, format=None)
+            except Exception:  # Meta key absent: not completed
+                completed_at = None
+
+            certificates = []
+            if completed_at:
+                certificates.append({
+                    "type": "course_certificate",
+                    "course_id": course_id,
+                    "timestamp": str(completed_at).strip(),
+                })
+            return {
+                "user_id": user_id,
+                "certificates": certificates,
+                "total": len(certificates),
+            }
+
+        # Filter server-side: only the completion keys cross the pipe,
+        # not the user's entire meta table
+        sql = (
+            "SELECT meta_key, meta_value FROM wp_usermeta "
+            f"WHERE user_id = {user_id} "
+            "AND (meta_key LIKE 'course_completed_%' "
+            "OR meta_key LIKE 'quiz_completed_%')"
+        )
+        raw = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
 
         certificates = []
-        for meta in all_meta:
-            if 'course_completed_' in meta['meta_key']:
-                course_id = meta['meta_key'].replace('course_completed_', '')
+        for line in str(raw).splitlines():
+            fields = line.split("\t", 1)
+            if len(fields) != 2:
+                continue
+            key, value = fields
+            if key.startswith('course_completed_'):
                 certificates.append({
                     "type": "course_certificate",
-                    "course_id": int(course_id),
-                    "timestamp": meta['meta_value'],
+                    "course_id": int(key.removeprefix('course_completed_')),
+                    "timestamp": value,
                 })
-            elif 'quiz_completed_' in meta['meta_key']:
-                quiz_id = meta['meta_key'].replace('quiz_completed_', '')
+            elif key.startswith('quiz_completed_'):
                 certificates.append({
                     "type": "quiz_certificate",
-                    "quiz_id": int(quiz_id),
-                    "timestamp": meta['meta_value'],
+                    "quiz_id": int(key.removeprefix('quiz_completed_')),
+                    "timestamp": value,
                 })
 
         return {
@@ -2125,43 +2841,211 @@ class LearnDashManager:
 
     # ==================== REPORTING ====================
 
-    def export_completion_report(self, course_id: int, format: str = "json") -> dict:
+    def export_completion_report(
+        self, course_id: Optional[int] = None, format: str = "json"
+    ) -> dict:
         """
-        Generate a compliance/completion report for a course.
+        Generate a compliance/completion report.
 
         Args:
-            course_id: Course post ID
+            course_id: Course post ID, or None to report on all courses
             format: Output format (json, csv)
 
         Returns:
-            Completion report data
+            Completion report data (per-course reports under "reports"
+            when course_id is None)
 
         Raises:
             ValueError: If input validation fails
         """
         # Validate inputs
-        course_id = self._validate_positive_int(course_id, "course_id")
+        if course_id is not None:
+            course_id = self._validate_positive_int(course_id, "course_id")
         format = self._validate_literal(format, "format", ["json", "csv"])
 
-        # Get all enrolled users (Security: quote all parameters)
-        cmd = f'post meta get {shlex.quote(str(course_id))} {shlex.quote("learndash_course_users")}'
-        enrolled_users_data = self.cli.execute(cmd)
+        if course_id is not None:
+            report = self._course_report(course_id)
+            report["format"] = format
+            return report
+
+        # All-courses report: enrollments for every course come from one
+        # SQL query, and the remaining per-course work (post info,
+        # lesson lists) is dominated by waiting on wp-cli round trips,
+        # so fan it out across threads
+        courses = self.list_courses(status="any", limit=-1)
+        all_ids = [int(course["ID"]) for course in courses]
+        students_map = self._bulk_course_students(all_ids)
+        summary_map = self._bulk_course_summary(all_ids)
+        with ThreadPoolExecutor(max_workers=self.REPORT_WORKERS) as pool:
+            reports = list(
+                pool.map(
+                    lambda cid: self._course_report(
+                        cid, students_map.get(cid, []), summary_map.get(cid)
+                    ),
+                    all_ids,
+                )
+            )
 
-        # Get course info
-        course = self.cli.get_post(course_id)
-        lessons = self.list_course_lessons(course_id)
+        # Completion markers for every course come from one SQL query;
+        # overlapping student sets cost nothing extra since the lookup
+        # is keyed by meta_key, not by (user, course) pair
+        course_ids = [report["course_id"] for report in reports]
+        completed_by_course = self._completed_by_course(course_ids)
 
-        report = {
-            "course_id": course_id,
-            "course_title": course.get('title', {}).get('rendered', 'Unknown'),
-            "report_date": self.cli.execute('eval "date +%Y-%m-%d"'),
-            "total_lessons": len(lessons),
-            "enrolled_users_data": enrolled_users_data,
+        for report in reports:
+            completed = completed_by_course.get(report["course_id"], [])
+            report["completed_user_ids"] = completed
+            report["completed_count"] = len(completed)
+
+        return {
+            "course_count": len(reports),
+            "reports": reports,
             "format": format,
-            "note": "This report provides enrollment data. For detailed completion, iterate through users with get_user_progress()",
         }
 
-        return report
+    def iter_completion_report(self, course_id: Optional[int] = None):
+        """
+        Yield completion-report rows one course at a time.
+
+        Streaming variant of export_completion_report: peak memory stays
+        at one report regardless of catalog size, so callers can write
+        rows straight to CSV/NDJSON. The completion map is still fetched
+        in one SQL query up front.
+
+        Args:
+            course_id: Course post ID, or None to stream every course
+
+        Yields:
+            Per-course report dicts
+        """
+        if course_id is not None:
+            course_id = self._validate_positive_int(course_id, "course_id")
+            yield self._course_report(course_id)
+            return
+
+        courses = self.list_courses(status="any", limit=-1)
+        course_ids = [int(course["ID"]) for course in courses]
+        completed_by_course = self._completed_by_course(course_ids)
+        students_map = self._bulk_course_students(course_ids)
+        summary_map = self._bulk_course_summary(course_ids)
+
+        for cid in course_ids:
+            report = self._course_report(
+                cid, students_map.get(cid, []), summary_map.get(cid)
+            )
+            completed = completed_by_course.get(cid, [])
+            report["completed_user_ids"] = completed
+            report["completed_count"] = len(completed)
+            yield report
+
+    def _completed_by_course(self, course_ids: list[int]) -> dict[int, list[int]]:
+        """Map course_id -> completed user IDs via one wp_usermeta query."""
+        if not course_ids:
+            return {}
+
+        keys = ",".join(f"'course_completed_{cid}'" for cid in course_ids)
+        sql = f"SELECT user_id, meta_key FROM wp_usermeta WHERE meta_key IN ({keys})"
+        raw = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
+
+        completed_by_course: dict[int, list[int]] = {}
+        for line in str(raw).splitlines():
+            fields = line.split("\t")
+            if len(fields) == 2 and fields[1].startswith("course_completed_"):
+                cid = int(fields[1].removeprefix("course_completed_"))
+                completed_by_course.setdefault(cid, []).append(int(fields[0]))
+        return completed_by_course
+
+    def _bulk_course_students(self, course_ids: list[int]) -> dict[int, list[int]]:
+        """Map course_id -> enrolled user IDs via one wp_postmeta query."""
+        if not course_ids:
+            return {}
+
+        ids_sql = ",".join(str(cid) for cid in course_ids)
+        sql = (
+            "SELECT post_id, meta_value FROM wp_postmeta "
+            f"WHERE meta_key = 'learndash_course_users' AND post_id IN ({ids_sql})"
+        )
+        raw = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
+
+        # enroll_user appends one row per user holding a bare int, so a
+        # course can have many rows; aggregate instead of overwriting,
+        # and accept scalar rows alongside serialized arrays
+        students: dict[int, list[int]] = {}
+        for line in str(raw).splitlines():
+            fields = line.split("\t", 1)
+            if len(fields) != 2:
+                continue
+            uids = students.setdefault(int(fields[0]), [])
+            parsed = self._unserialize_php(fields[1])
+            if isinstance(parsed, dict):
+                uids.extend(int(uid) for uid in parsed.values())
+            elif isinstance(parsed, list):
+                uids.extend(int(uid) for uid in parsed)
+            elif fields[1].strip().isdigit():
+                uids.append(int(fields[1].strip()))
+        # Dedupe in case a serialized array and per-user rows coexist
+        return {cid: list(dict.fromkeys(uids)) for cid, uids in students.items()}
+
+    def _bulk_course_summary(self, course_ids: list[int]) -> dict[int, dict]:
+        """Map course_id -> title/lesson_count via one wp db query."""
+        if not course_ids:
+            return {}
+
+        ids_sql = ",".join(str(cid) for cid in course_ids)
+        sql = (
+            "SELECT p.ID, "
+            "(SELECT COUNT(*) FROM wp_postmeta pm "
+            "JOIN wp_posts p2 ON pm.post_id = p2.ID "
+            "WHERE pm.meta_key = 'course_id' AND pm.meta_value = p.ID "
+            "AND p2.post_type = 'sfwd-lessons') AS lesson_count, "
+            "p.post_title "
+            f"FROM wp_posts p WHERE p.ID IN ({ids_sql})"
+        )
+        raw = self.cli.execute(
+            f'db query {shlex.quote(sql)} --skip-column-names', format=None
+        )
+
+        summary: dict[int, dict] = {}
+        # Title comes last so a tab inside it survives the maxsplit
+        for line in str(raw).splitlines():
+            fields = line.split("\t", 2)
+            if len(fields) == 3:
+                summary[int(fields[0])] = {
+                    "title": fields[2],
+                    "lesson_count": int(fields[1]),
+                }
+        return summary
+
+    def _course_report(
+        self,
+        course_id: int,
+        enrolled_user_ids: Optional[list[int]] = None,
+        summary: Optional[dict] = None,
+    ) -> dict:
+        """Build the completion report for one course."""
+        if enrolled_user_ids is None:
+            # Single-course path; bulk callers pre-fetch all enrollments
+            enrolled_user_ids = self._bulk_course_students([course_id]).get(
+                course_id, []
+            )
+        if summary is None:
+            # Title and lesson count in one SQL round trip instead of a
+            # post fetch plus a lesson listing
+            summary = self._bulk_course_summary([course_id]).get(course_id)
+
+        return {
+            "course_id": course_id,
+            "course_title": summary["title"] if summary else "Unknown",
+            "report_date": time.strftime("%Y-%m-%d"),
+            "total_lessons": summary["lesson_count"] if summary else 0,
+            "enrolled_user_ids": enrolled_user_ids,
+            "enrolled_count": len(enrolled_user_ids),
+            "note": "This report provides enrollment data. For detailed completion, iterate through users with get_user_progress()",
+        }
 
     # ==================== ADVANCED ENROLLMENT & PROGRESS ====================
 
@@ -2200,12 +3084,11 @@ if ($users && !empty($users->results)) {{
 }}
 echo json_encode($result);
 '''
-        cmd = f'eval {shlex.quote(php_code)}'
-        result = self.cli.execute(cmd, format=None)
+        result = self.cli.execute_php(php_code)
 
         try:
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
             return {"course_id": course_id, "users": [], "count": 0, "error": result}
 
     def migrate_students(
@@ -2285,12 +3168,11 @@ foreach ($users as $user_id) {{
 
 echo json_encode($result);
 '''
-        cmd = f'eval {shlex.quote(php_code)}'
-        result = self.cli.execute(cmd, format=None)
+        result = self.cli.execute_php(php_code)
 
         try:
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
             return {"error": result}
 
     def mark_course_complete(
@@ -2353,12 +3235,11 @@ echo json_encode(array(
     "completion_date" => date("Y-m-d H:i:s", $completion_time)
 ));
 '''
-        cmd = f'eval {shlex.quote(php_code)}'
-        result = self.cli.execute(cmd, format=None)
+        result = self.cli.execute_php(php_code)
 
         try:
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
             return {"success": False, "error": result}
 
     def get_student_progress(self, user_id: int, course_id: int) -> dict:
@@ -2404,12 +3285,11 @@ echo json_encode(array(
     "completion_date" => $completed_timestamp ? date("Y-m-d H:i:s", $completed_timestamp) : null
 ));
 '''
-        cmd = f'eval {shlex.quote(php_code)}'
-        result = self.cli.execute(cmd, format=None)
+        result = self.cli.execute_php(php_code)
 
         try:
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
             return {"user_id": user_id, "course_id": course_id, "error": result}
 
     def duplicate_course(
@@ -2576,10 +3456,9 @@ echo json_encode(array(
     "shared_steps_enabled" => $enable_shared_steps
 ));
 '''
-        cmd = f'eval {shlex.quote(php_code)}'
-        result = self.cli.execute(cmd, format=None)
+        result = self.cli.execute_php(php_code)
 
         try:
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _jloads(result)
+        except ValueError:  # covers json and orjson decode errors
             return {"success": False, "error": result}
@@ -3,9 +3,17 @@
 import json
 import shlex
 import paramiko
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 from .config import WordPressConfig
 
+try:  # Optional: C-extension parser for the large report payloads
+    import orjson
+
+    _jloads = orjson.loads
+except ImportError:
+    _jloads = json.loads
+
 
 class WPCLIError(Exception):
     """Exception raised for wp-cli command errors."""
@@ -15,9 +23,23 @@ class WPCLIError(Exception):
 class WPCLIClient:
     """Client for executing wp-cli commands remotely."""
 
+    # Marker echoed after each shell_eval() block so the reader knows
+    # where one response ends on the persistent wp shell channel
+    SHELL_SENTINEL = "---WP-SHELL-END---"
+
+    # Upper bound on waiting for the sentinel; a snippet that fails to
+    # parse never prints it, and an unbounded read would block forever
+    SHELL_TIMEOUT = 30.0
+
+    # PHP snippets longer than this go through a remote temp file and
+    # `wp eval-file` instead of inline `wp eval` shell arguments
+    PHP_INLINE_LIMIT = 4096
+
     def __init__(self, config: WordPressConfig):
         self.config = config
         self.ssh_client: Optional[paramiko.SSHClient] = None
+        self._shell_stdin = None
+        self._shell_stdout = None
 
     def connect(self):
         """Establish SSH connection."""
@@ -44,17 +66,96 @@ class WPCLIClient:
 
     def disconnect(self):
         """Close SSH connection."""
+        self.close_shell()
         if self.ssh_client:
             self.ssh_client.close()
             self.ssh_client = None
 
-    def execute(self, command: str, format: str = "json") -> Any:
+    def open_shell(self):
+        """
+        Start a persistent `wp shell` on the remote host.
+
+        Each execute() call pays a full PHP + WordPress bootstrap. A
+        long-lived shell pays that cost once; subsequent shell_eval()
+        calls are just stdin/stdout round trips on the open channel.
+        """
+        if self._shell_stdin is not None:
+            return
+
+        self.connect()
+        stdin, stdout, _stderr = self.ssh_client.exec_command(
+            f"cd {self.config.remote_path} && wp shell --basic"
+        )
+        self._shell_stdin = stdin
+        self._shell_stdout = stdout
+
+    def close_shell(self):
+        """Terminate the persistent wp shell, if one is open."""
+        if self._shell_stdin is not None:
+            try:
+                self._shell_stdin.write("exit\n")
+                self._shell_stdin.flush()
+                self._shell_stdin.channel.close()
+            except (OSError, EOFError):
+                pass
+            self._shell_stdin = None
+            self._shell_stdout = None
+
+    def shell_eval(self, php: str) -> str:
+        """
+        Run a block of PHP on the persistent wp shell.
+
+        Args:
+            php: PHP statements (no surrounding <?php tags)
+
+        Returns:
+            Everything the block printed, as a string
+
+        Falls back to a one-shot `wp eval` if the shell cannot be used.
+        """
+        try:
+            self.open_shell()
+            self._shell_stdout.channel.settimeout(self.SHELL_TIMEOUT)
+            self._shell_stdin.write(
+                f'{php} echo "\\n{self.SHELL_SENTINEL}\\n";\n'
+            )
+            self._shell_stdin.flush()
+
+            lines = []
+            for line in self._shell_stdout:
+                # The REPL writes its prompt to the same stream; it has
+                # no trailing newline, so it prefixes the next real line
+                while line.startswith("wp> "):
+                    line = line[4:]
+                stripped = line.strip()
+                if stripped == self.SHELL_SENTINEL:
+                    break
+                if stripped == "wp>":
+                    continue
+                lines.append(line)
+            else:
+                raise WPCLIError("wp shell closed before sentinel")
+            return "".join(lines).strip()
+        except (OSError, EOFError, WPCLIError):
+            # Shell died, never started, or timed out waiting for the
+            # sentinel (socket.timeout is an OSError); run one-shot
+            self.close_shell()
+            return self.execute(f"eval {shlex.quote(php)}", format=None)
+
+    def execute(
+        self,
+        command: str,
+        format: str = "json",
+        returns: Optional[type] = None,
+    ) -> Any:
         """
         Execute a wp-cli command.
 
         Args:
             command: wp-cli command (without 'wp' prefix)
             format: Output format (json, csv, table, etc.)
+            returns: Normalize the output to this type (currently int,
+                for --porcelain commands that print a bare ID)
 
         Returns:
             Command output (parsed JSON if format=json)
@@ -80,17 +181,135 @@ class WPCLIClient:
         # Parse JSON output if requested
         if format == "json" and output:
             try:
-                return json.loads(output)
-            except json.JSONDecodeError:
+                output = _jloads(output)
+            except ValueError:  # covers json and orjson decode errors
+                pass
+
+        # One conversion site instead of isinstance checks in callers
+        if returns is int:
+            return int(str(output).strip())
+        return output
+
+    def execute_php(self, php: str, format: Optional[str] = None) -> Any:
+        """
+        Run a PHP snippet in the WordPress context.
+
+        Short snippets are passed inline via `wp eval`; longer scripts
+        (bulk ID arrays, report loops) are streamed over stdin to
+        `wp eval-file -`, which never touches the shell tokenizer and
+        has no argument-length limit.
+
+        Args:
+            php: PHP statements (no surrounding <?php tag needed)
+            format: Output format passed through to execute()
+
+        Returns:
+            Whatever the snippet printed (parsed JSON if format=json)
+        """
+        if len(php) <= self.PHP_INLINE_LIMIT:
+            # When the persistent shell is up, reuse its bootstrapped
+            # WordPress instead of paying a fresh PHP boot per snippet.
+            # The REPL evaluates input line by line, so a multi-line
+            # snippet would parse-error per line yet still print the
+            # sentinel — only newline-free PHP can ride the shell
+            if self._shell_stdin is not None and "\n" not in php:
+                output = self.shell_eval(php)
+                if format == "json" and output:
+                    try:
+                        return _jloads(output)
+                    except ValueError:  # covers json and orjson decode errors
+                        return output
                 return output
+            return self.execute(f"eval {shlex.quote(php)}", format=format)
+
+        self.connect()
+        stdin, stdout, stderr = self.ssh_client.exec_command(
+            f"cd {self.config.remote_path} && wp eval-file -"
+        )
+        stdin.write("<?php\n" + php)
+        stdin.channel.shutdown_write()
 
+        exit_code = stdout.channel.recv_exit_status()
+        output = stdout.read().decode('utf-8').strip()
+        error = stderr.read().decode('utf-8').strip()
+
+        if exit_code != 0:
+            raise WPCLIError(f"wp eval-file failed: {error or output}")
+
+        if format == "json" and output:
+            try:
+                return _jloads(output)
+            except ValueError:  # covers json and orjson decode errors
+                return output
         return output
 
+    def execute_many(
+        self,
+        commands: list[str],
+        format: Optional[str] = "json",
+        max_workers: int = 4,
+    ) -> list[Any]:
+        """
+        Run independent wp-cli commands concurrently.
+
+        Each command gets its own channel on the shared SSH connection,
+        so the remote PHP bootstraps overlap instead of running back to
+        back. Only use this for commands with no ordering dependency.
+
+        Args:
+            commands: wp-cli commands (without 'wp' prefix)
+            format: Output format applied to every command
+            max_workers: Upper bound on concurrent channels
+
+        Returns:
+            Outputs in the same order as commands
+        """
+        if not commands:
+            return []
+
+        self.connect()
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(commands))
+        ) as pool:
+            return list(
+                pool.map(lambda cmd: self.execute(cmd, format=format), commands)
+            )
+
+    def execute_argv(
+        self,
+        argv: list[str],
+        format: Optional[str] = "json",
+        returns: Optional[type] = None,
+    ) -> Any:
+        """
+        Execute a wp-cli command from an argv-style argument list.
+
+        Every element is shell-quoted here, so callers pass raw values
+        (titles, search strings) without doing their own escaping —
+        quoting lives in one place instead of at every f-string call
+        site. The transport is still a remote shell over SSH, so this is
+        the closest equivalent to a shell=False argv exec.
+
+        Args:
+            argv: wp-cli arguments (without 'wp' prefix), unquoted
+            format: Output format (json, csv, table, etc.)
+            returns: Normalize the output to this type (see execute())
+
+        Returns:
+            Command output (parsed JSON if format=json)
+        """
+        return self.execute(
+            " ".join(shlex.quote(str(arg)) for arg in argv),
+            format=format,
+            returns=returns,
+        )
+
     def get_info(self) -> dict:
         """Get WordPress site information."""
-        core_version = self.execute("core version", format=None)
-        site_url = self.execute("option get siteurl", format=None)
-        site_title = self.execute("option get blogname", format=None)
+        core_version, site_url, site_title = self.execute_many(
+            ["core version", "option get siteurl", "option get blogname"],
+            format=None,
+        )
 
         return {
             "version": core_version,
@@ -105,11 +324,11 @@ class WPCLIClient:
         Args:
             status: Filter by status (active, inactive, must-use)
         """
-        cmd = "plugin list"
+        argv = ["plugin", "list"]
         if status:
-            cmd += f" --status={status}"
+            argv.append(f"--status={status}")
 
-        return self.execute(cmd, format="json")
+        return self.execute_argv(argv, format="json")
 
     def list_themes(self) -> list[dict]:
         """List installed themes."""
@@ -123,15 +342,18 @@ class WPCLIClient:
             search: Search query
             post_type: Post type to search (post, page, etc.)
         """
-        # Security: Use shlex.quote to prevent command injection
-        cmd = f"post list --post_type={shlex.quote(post_type)} --s={shlex.quote(search)}"
-        return self.execute(cmd, format="json")
+        # Security: execute_argv quotes every element, preventing injection
+        return self.execute_argv(
+            ["post", "list", f"--post_type={post_type}", f"--s={search}"],
+            format="json",
+        )
 
     def list_posts(
         self,
         post_type: str = "post",
         post_status: str = "publish",
-        limit: int = 10
+        limit: int = 10,
+        fields: Optional[str] = None,
     ) -> list[dict]:
         """
         List posts.
@@ -140,18 +362,31 @@ class WPCLIClient:
             post_type: Post type (post, page, etc.)
             post_status: Post status (publish, draft, etc.)
             limit: Number of posts to return
+            fields: Comma-separated columns to return (all when None)
         """
-        cmd = f"post list --post_type={post_type} --post_status={post_status} --posts_per_page={limit}"
-        return self.execute(cmd, format="json")
+        argv = [
+            "post",
+            "list",
+            f"--post_type={post_type}",
+            f"--post_status={post_status}",
+            f"--posts_per_page={limit}",
+        ]
+        if fields:
+            argv.append(f"--fields={fields}")
+        return self.execute_argv(argv, format="json")
 
     def get_post(self, post_id: int) -> dict:
         """Get post details by ID."""
-        return self.execute(f"post get {post_id}", format="json")
+        return self.execute_argv(["post", "get", post_id], format="json")
 
     def check_updates(self) -> dict:
         """Check for available updates."""
-        return {
-            "core": self.execute("core check-update", format="json"),
-            "plugins": self.execute("plugin list --update=available", format="json"),
-            "themes": self.execute("theme list --update=available", format="json"),
-        }
+        core, plugins, themes = self.execute_many(
+            [
+                "core check-update",
+                "plugin list --update=available",
+                "theme list --update=available",
+            ],
+            format="json",
+        )
+        return {"core": core, "plugins": plugins, "themes": themes}
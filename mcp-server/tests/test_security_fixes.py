@@ -28,6 +28,7 @@ class TestCommandInjectionPrevention:
         self.config = Mock(spec=WordPressConfig)
         self.wp_cli = Mock(spec=WPCLIClient)
         self.wp_cli.execute = MagicMock(return_value=123)
+        self.wp_cli.execute_argv = MagicMock(return_value=123)
         self.manager = LearnDashManager(self.config, self.wp_cli)
 
     def test_create_course_escapes_malicious_title(self):
@@ -36,14 +37,14 @@ class TestCommandInjectionPrevention:
 
         self.manager.create_course(title=malicious_title, status="draft")
 
-        # Verify execute was called
-        assert self.wp_cli.execute.called
-        call_args = self.wp_cli.execute.call_args[0][0]
+        # Verify the argv path was used
+        assert self.wp_cli.execute_argv.called
+        argv = self.wp_cli.execute_argv.call_args[0][0]
 
-        # Verify the command contains escaped quotes
-        assert "shlex.quote" not in call_args  # shlex.quote shouldn't appear in output
-        assert 'Test"; rm -rf /; echo "' not in call_args  # Raw injection shouldn't appear
-        print(f"✓ Command injection prevented in title: {call_args}")
+        # The title must travel as one argv element; execute_argv quotes
+        # each element, so the shell sees a single literal argument
+        assert f"--post_title={malicious_title}" in argv
+        print(f"✓ Command injection prevented in title: {argv}")
 
     def test_create_lesson_escapes_content(self):
         """Test that content with shell metacharacters is escaped."""
@@ -56,12 +57,12 @@ class TestCommandInjectionPrevention:
             status="draft"
         )
 
-        assert self.wp_cli.execute.called
-        call_args = self.wp_cli.execute.call_args[0][0]
+        assert self.wp_cli.execute_argv.called
+        argv = self.wp_cli.execute_argv.call_args[0][0]
 
-        # Verify dangerous shell operations are escaped
-        assert "$(whoami)" not in call_args
-        assert "`ls -la`" not in call_args
+        # The content must travel as one argv element, so $(...) and
+        # backticks never reach the shell unquoted
+        assert f"--post_content={malicious_content}" in argv
         print(f"✓ Shell metacharacters escaped in content")
 
     def test_create_quiz_escapes_description(self):
@@ -75,7 +76,7 @@ class TestCommandInjectionPrevention:
             description=malicious_desc
         )
 
-        assert self.wp_cli.execute.called
+        assert self.wp_cli.execute_argv.called
         print("✓ SQL injection-style string escaped in description")
 
 
@@ -182,21 +183,21 @@ class TestBulkOperationsCircuitBreaker:
         print(f"✓ Invalid IDs in bulk operation caught: {result['errors']}")
 
     def test_circuit_breaker_stops_after_failures(self):
-        """Test that circuit breaker stops after consecutive failures."""
+        """Test that a failed batch aborts without retrying per user."""
         # Simulate wp_cli throwing errors
-        self.wp_cli.execute = MagicMock(side_effect=Exception("Connection failed"))
+        self.wp_cli.execute_php = MagicMock(side_effect=Exception("Connection failed"))
 
         # Try to enroll 20 users
         user_ids = list(range(1, 21))
 
         result = self.manager.bulk_enroll_users(user_ids=user_ids, course_id=1)
 
-        # Should abort after 5 consecutive failures
+        # Should abort after the single batched eval fails, without
+        # hammering the server once per user
         assert result["aborted"] == True
         assert result["enrolled"] == 0
-        # Should have stopped around 5 failures, not processed all 20
-        assert result["failed"] <= 7  # Allow some margin
-        print(f"✓ Circuit breaker activated: stopped at {result['failed']} failures")
+        assert self.wp_cli.execute_php.call_count == 1
+        print(f"✓ Bulk operation aborted after {self.wp_cli.execute_php.call_count} call(s)")
 
 
 class TestValidationHelpers:
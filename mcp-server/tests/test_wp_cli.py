@@ -0,0 +1,108 @@
+"""
+Tests for the persistent wp shell transport in WPCLIClient.
+
+shell_eval() shares a long-lived `wp shell --basic` channel across
+calls, so it has to cope with REPL prompt chrome in the output stream
+and with snippets that never print the sentinel (parse errors).
+"""
+
+from unittest.mock import Mock, MagicMock
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import WordPressConfig
+from src.wp_cli import WPCLIClient
+
+SENTINEL = WPCLIClient.SHELL_SENTINEL
+
+
+class FakeChannel:
+    """Records settimeout() calls; close() is a no-op."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def settimeout(self, timeout):
+        self.timeouts.append(timeout)
+
+    def close(self):
+        pass
+
+
+class FakeStream:
+    """Stands in for the shell's stdin and stdout file objects."""
+
+    def __init__(self, lines=()):
+        self.lines = list(lines)
+        self.written = []
+        self.channel = FakeChannel()
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def write(self, data):
+        self.written.append(data)
+
+    def flush(self):
+        pass
+
+
+def make_client(stdout_lines):
+    """Build a client with an already-open fake shell."""
+    client = WPCLIClient(Mock(spec=WordPressConfig))
+    client._shell_stdin = FakeStream()
+    client._shell_stdout = FakeStream(stdout_lines)
+    return client
+
+
+class TestShellEval:
+    """Test shell_eval() payload framing on the persistent channel."""
+
+    def test_strips_repl_prompt_chrome(self):
+        """Prompt prefixes and prompt-only lines never reach callers."""
+        client = make_client([
+            "wp> wp> hello\n",
+            "wp>\n",
+            "world\n",
+            f"{SENTINEL}\n",
+        ])
+        assert client.shell_eval('echo "hello\\nworld";') == "hello\nworld"
+
+    def test_prompt_prefixed_sentinel_recognized(self):
+        """The sentinel is found even when the prompt precedes it."""
+        client = make_client(["wp> payload\n", f"wp> {SENTINEL}\n"])
+        assert client.shell_eval('echo "payload";') == "payload"
+
+    def test_sets_read_timeout_on_channel(self):
+        """The read loop is bounded by SHELL_TIMEOUT."""
+        client = make_client([f"{SENTINEL}\n"])
+        stdout = client._shell_stdout
+        client.shell_eval("1;")
+        assert stdout.channel.timeouts == [WPCLIClient.SHELL_TIMEOUT]
+
+    def test_execute_php_routes_multiline_around_shell(self):
+        """The REPL evaluates line by line, so multi-line snippets must
+        use one-shot eval even while the shell is open."""
+        client = make_client([])
+        client.shell_eval = MagicMock(return_value="shell")
+        client.execute = MagicMock(return_value="oneshot")
+
+        assert client.execute_php("$a = 1;\necho $a;") == "oneshot"
+        assert not client.shell_eval.called
+        assert client.execute_php("echo 1;") == "shell"
+
+    def test_falls_back_when_sentinel_never_arrives(self):
+        """A parse-failed snippet never echoes the sentinel; EOF (or a
+        read timeout) must tear the shell down and route to one-shot
+        eval instead of blocking forever."""
+        client = make_client(["wp> Parse error: syntax error\n"])
+        client.execute = MagicMock(return_value="fallback")
+
+        assert client.shell_eval("broken(") == "fallback"
+        assert client.execute.called
+        # Shell was torn down so the next call starts clean
+        assert client._shell_stdin is None
+        assert client._shell_stdout is None